@@ -14,13 +14,27 @@ from pathlib import Path
 # Ensure the src/ package is importable when running from the project root
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
 import streamlit as st
-import plotly.graph_objects as go
-from datetime import datetime
 
-from weather_alert.geocode import geocode, LocationNotFoundError
-from weather_alert.weather import fetch_forecast, fetch_daily_forecast
+from weather_alert.config import load_config
+from weather_alert.geocode import GEOCODE_CACHE_TTL_SECONDS, geocode, LocationNotFoundError
+from weather_alert.weather import (
+    COORD_CACHE_PRECISION,
+    FORECAST_CACHE_TTL_SECONDS,
+    fetch_daily_forecast,
+    fetch_forecast,
+)
 from weather_alert.rules import evaluate_rules
+from weather_alert.utils import fmt_day as _fmt_day
+
+if TYPE_CHECKING:
+    # plotly and pandas are heavy to import; they are loaded lazily on first use
+    import pandas as pd
+    import plotly.graph_objects as go
 
 
 # ─────────────────────────────────────────────────────────────
@@ -39,219 +53,20 @@ st.set_page_config(
 # CSS injection
 # ─────────────────────────────────────────────────────────────
 
-CUSTOM_CSS = """
-<style>
-  /* ── Reset Streamlit chrome ── */
-  #MainMenu, footer, header { visibility: hidden; }
-  .block-container { padding-top: 2rem; padding-bottom: 4rem; max-width: 960px; }
-
-  /* ── Typography & base ── */
-  html, body, [class*="css"] {
-    font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display",
-                 "SF Pro Text", "Segoe UI", Roboto, sans-serif;
-    background-color: #0a0a0a;
-    color: #f5f5f7;
-  }
-
-  /* ── Search input ── */
-  .stTextInput > div > div > input {
-    background: #1c1c1e !important;
-    border: 1px solid #3a3a3c !important;
-    border-radius: 980px !important;
-    color: #f5f5f7 !important;
-    font-size: 1.1rem !important;
-    padding: 0.75rem 1.25rem !important;
-    text-align: center;
-  }
-  .stTextInput > div > div > input::placeholder { color: #636366 !important; }
-  .stTextInput > div > div > input:focus {
-    border-color: #0a84ff !important;
-    box-shadow: 0 0 0 3px rgba(10,132,255,0.2) !important;
-  }
-
-  /* ── Primary button ── */
-  .stButton > button {
-    background: #0a84ff !important;
-    color: #ffffff !important;
-    border: none !important;
-    border-radius: 980px !important;
-    font-size: 1rem !important;
-    font-weight: 600 !important;
-    padding: 0.6rem 2rem !important;
-    letter-spacing: -0.01em;
-    transition: opacity 0.15s ease;
-  }
-  .stButton > button:hover { opacity: 0.85; }
-  .stButton > button:active { opacity: 0.7; }
-
-  /* ── Cards ── */
-  .wa-card {
-    background: #1c1c1e;
-    border: 1px solid #2c2c2e;
-    border-radius: 16px;
-    padding: 28px 32px;
-    margin-bottom: 1.5rem;
-  }
-
-  /* ── Hero temperature ── */
-  .hero-temp {
-    font-size: 7rem;
-    font-weight: 700;
-    letter-spacing: -0.04em;
-    line-height: 1;
-    background: linear-gradient(180deg, #ffffff 60%, #8e8e93 100%);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    background-clip: text;
-  }
-  .hero-feels {
-    font-size: 1rem;
-    color: #8e8e93;
-    font-weight: 400;
-    margin-top: 0.25rem;
-    letter-spacing: -0.01em;
-  }
-
-  /* ── Stat pills ── */
-  .stat-pill {
-    background: #2c2c2e;
-    border-radius: 12px;
-    padding: 14px 18px;
-    display: inline-block;
-    width: 100%;
-  }
-  .stat-label {
-    font-size: 0.68rem;
-    text-transform: uppercase;
-    letter-spacing: 0.08em;
-    color: #8e8e93;
-    font-weight: 500;
-  }
-  .stat-value {
-    font-size: 1.6rem;
-    font-weight: 700;
-    letter-spacing: -0.03em;
-    color: #f5f5f7;
-    line-height: 1.2;
-  }
-  .stat-unit {
-    font-size: 0.9rem;
-    color: #8e8e93;
-    font-weight: 400;
-  }
-
-  /* ── Alert pill ── */
-  .alert-pill {
-    background: rgba(255, 69, 58, 0.15);
-    border: 1px solid rgba(255, 69, 58, 0.4);
-    border-radius: 8px;
-    color: #ff453a;
-    font-size: 0.9rem;
-    font-weight: 500;
-    padding: 8px 16px;
-    margin-top: 12px;
-    display: inline-block;
-  }
-
-  /* ── Error card ── */
-  .error-card {
-    background: rgba(255, 69, 58, 0.1);
-    border: 1px solid rgba(255, 69, 58, 0.3);
-    border-radius: 12px;
-    color: #ff453a;
-    font-size: 1rem;
-    padding: 20px 24px;
-    text-align: center;
-    margin: 1rem 0;
-  }
-
-  /* ── Condition line ── */
-  .condition-line {
-    color: #8e8e93;
-    font-size: 0.95rem;
-    letter-spacing: -0.01em;
-    margin-top: 1rem;
-    text-align: center;
-  }
-
-  /* ── Section heading ── */
-  .section-label {
-    font-size: 0.72rem;
-    text-transform: uppercase;
-    letter-spacing: 0.1em;
-    color: #636366;
-    font-weight: 600;
-    margin-bottom: 0.75rem;
-  }
-
-  /* ── Forecast table ── */
-  .wa-table { width: 100%; border-collapse: collapse; font-size: 0.95rem; }
-  .wa-table th {
-    font-size: 0.65rem;
-    text-transform: uppercase;
-    letter-spacing: 0.1em;
-    color: #636366;
-    font-weight: 600;
-    padding: 8px 12px;
-    text-align: right;
-    border-bottom: 1px solid #2c2c2e;
-  }
-  .wa-table th:first-child { text-align: left; }
-  .wa-table td {
-    padding: 12px 12px;
-    color: #f5f5f7;
-    text-align: right;
-    border-bottom: 1px solid #1c1c1e;
-    font-variant-numeric: tabular-nums;
-    font-weight: 500;
-  }
-  .wa-table td:first-child { text-align: left; color: #f5f5f7; }
-  .wa-table tr:hover td { background: #2c2c2e; }
-  .wa-table tr.today td { background: rgba(10,132,255,0.08); }
-  .wa-table tr.today td:first-child { color: #0a84ff; font-weight: 600; }
-
-  /* ── Segmented control (radio) ── */
-  .stRadio > div { gap: 0 !important; }
-  .stRadio > div > label {
-    background: #1c1c1e;
-    border: 1px solid #3a3a3c;
-    color: #8e8e93 !important;
-    border-radius: 0;
-    padding: 0.45rem 1.2rem;
-    font-size: 0.9rem;
-    font-weight: 500;
-    cursor: pointer;
-    margin: 0 !important;
-    transition: all 0.15s;
-  }
-  .stRadio > div > label:first-child { border-radius: 8px 0 0 8px; }
-  .stRadio > div > label:last-child  { border-radius: 0 8px 8px 0; border-left: none; }
-  .stRadio > div > label[data-checked="true"] {
-    background: #0a84ff !important;
-    border-color: #0a84ff !important;
-    color: #ffffff !important;
-  }
-
-  /* ── Location resolved text ── */
-  .location-resolved {
-    color: #8e8e93;
-    font-size: 0.85rem;
-    text-align: center;
-    margin-top: 0.5rem;
-  }
-
-  /* ── Footer ── */
-  .wa-footer {
-    text-align: center;
-    color: #48484a;
-    font-size: 0.8rem;
-    padding: 3rem 0 1rem;
-    letter-spacing: -0.005em;
-  }
-</style>
-"""
+THEME_CSS_PATH = Path(__file__).parent / "static" / "theme.css"
+
+
+@st.cache_resource
+def load_custom_css() -> str:
+    """Read the dashboard theme once per server process and wrap it in <style>."""
+    return f"<style>\n{THEME_CSS_PATH.read_text(encoding='utf-8')}</style>"
 
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Emitted on every full-script rerun on purpose: Streamlit clears elements a
+# rerun does not re-emit, so a once-per-session guard would drop the theme after
+# the first interaction. Forecast-window changes rerun only the forecast
+# fragment and never reach this line.
+st.markdown(load_custom_css(), unsafe_allow_html=True)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -281,29 +96,184 @@ PLOTLY_LAYOUT = dict(
 )
 
 
+# Forecast table columns — the snow columns are only shown when there is snow
+FORECAST_COLUMNS = ("Day", "Max °C", "Min °C", "Rain %", "Wind km/h")
+FORECAST_COLUMNS_SNOW = ("Day", "Max °C", "Min °C", "Rain %", "Snow (cm)", "Depth (cm)", "Wind km/h")
+FORECAST_COLUMN_CONFIG = {
+    "Day": st.column_config.TextColumn("Day"),
+    "Max °C": st.column_config.NumberColumn("Max °C", format="%.1f°"),
+    "Min °C": st.column_config.NumberColumn("Min °C", format="%.1f°"),
+    "Rain %": st.column_config.ProgressColumn("Rain %", format="%d%%", min_value=0, max_value=100),
+    "Snow (cm)": st.column_config.NumberColumn("Snow (cm)", format="%.1f"),
+    "Depth (cm)": st.column_config.NumberColumn("Depth (cm)", format="%.1f"),
+    "Wind km/h": st.column_config.TextColumn("Wind km/h"),
+}
+# Today's row in the forecast table (same accent as the rest of the theme)
+_TODAY_ROW_CSS = "background-color: rgba(10,132,255,0.08)"
+_TODAY_DAY_CSS = f"{_TODAY_ROW_CSS}; color: #0a84ff; font-weight: 600"
+
+
+def _today_row_styles(row: "pd.Series", today_row: int) -> list[str]:
+    """Styler.apply callback: highlight the row at index today_row."""
+    if row.name != today_row:
+        return [""] * len(row)
+    return [_TODAY_DAY_CSS if col == "Day" else _TODAY_ROW_CSS for col in row.index]
+
+
+# Minimal alert config used when config.toml is missing or invalid
+MOCK_CONFIG = {
+    "alerts": {
+        "rain_probability_threshold": 50,
+        "wind_speed_threshold": 30,
+        "feels_like_min": 2,
+        "lookahead_hours": 3,
+        "temperature_min": 0,
+    }
+}
+
+
+def _get_config() -> dict:
+    """Load config.toml, falling back to MOCK_CONFIG if it is missing or invalid.
+
+    load_config() caches the parsed file and re-reads it only when its mtime
+    changes, so calling this on every rerun is cheap and picks up edits.
+    """
+    try:
+        return load_config()
+    except (FileNotFoundError, ValueError):  # tomllib.TOMLDecodeError is a ValueError
+        return MOCK_CONFIG
+
+
+# WMO codes are all < 100, so a dense tuple indexed by code replaces the dict lookup
+_WEATHERCODE_LOOKUP: tuple[str, ...] = tuple(WEATHERCODE_LABELS.get(i, "") for i in range(100))
+
+
 def weathercode_label(code: int | None) -> str:
     """Return a human-readable label for an Open-Meteo weather code."""
     if code is None:
         return "Unknown"
-    return WEATHERCODE_LABELS.get(int(code), f"Code {code}")
+    label = _WEATHERCODE_LOOKUP[code] if 0 <= code < len(_WEATHERCODE_LOOKUP) else ""
+    return label or f"Code {code}"
 
 
 def fmt_day(date_str: str, today_str: str) -> tuple[str, bool]:
     """Format a date string as 'Mon 24 Feb'; also return True if it's today."""
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
     is_today = date_str == today_str
-    label = "Today" if is_today else dt.strftime("%a %d %b")
-    return label, is_today
+    return ("Today" if is_today else _fmt_day(date_str)), is_today
 
 
-def stat_html(label: str, value: str, unit: str = "") -> str:
-    """Render a stat pill as HTML."""
-    return f"""
+# Fixed HTML skeletons — filled with str.format at render time
+_STAT_TEMPLATE = """
     <div class="stat-pill">
       <div class="stat-label">{label}</div>
       <div class="stat-value">{value}<span class="stat-unit"> {unit}</span></div>
     </div>
     """
+_LOCATION_TEMPLATE = (
+    '<div class="location-resolved">'
+    "📍 {name} &nbsp;·&nbsp; {latitude:.4f}°, {longitude:.4f}°"
+    "</div>"
+)
+_ERROR_TEMPLATE = '<div class="error-card">⚠️ {message}</div>'
+_CONDITION_TEMPLATE = (
+    '<div class="condition-line">'
+    "{condition} &nbsp;·&nbsp; {name} &nbsp;·&nbsp; {time}"
+    "</div>"
+)
+_ALERT_TEMPLATE = '<div class="alert-pill">⚠️ {text}</div>'
+
+
+def stat_html(label: str, value: str, unit: str = "") -> str:
+    """Render a stat pill as HTML."""
+    return _STAT_TEMPLATE.format(label=label, value=value, unit=unit)
+
+
+def stat_grid_html(stats: list[tuple[str, str, str]], columns: int = 4) -> str:
+    """Render several (label, value, unit) pills as one CSS-grid block.
+
+    One st.markdown call replaces a st.columns row plus a markdown call per
+    pill. Pills are stripped and joined without newlines so the indented
+    template lines cannot be parsed as a Markdown code block.
+    """
+    pills = "".join(stat_html(*s).strip() for s in stats)
+    return f'<div class="stat-grid cols-{columns}">{pills}</div>'
+
+
+def build_temp_fig(
+    date_labels: tuple[str, ...],
+    temp_max: tuple[float, ...],
+    temp_min: tuple[float, ...],
+) -> "go.Figure":
+    """Build the temperature-range chart for the displayed days."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=date_labels, y=temp_max,
+        name="Max",
+        mode="lines",
+        line=dict(color="#0a84ff", width=2),
+        fill="tonexty",
+        fillcolor="rgba(10,132,255,0.08)",
+    ))
+    fig.add_trace(go.Scatter(
+        x=date_labels, y=temp_min,
+        name="Min",
+        mode="lines",
+        line=dict(color="#0a84ff", width=1, dash="dot"),
+        fill="tozeroy",
+        fillcolor="rgba(10,132,255,0.04)",
+    ))
+    fig.update_layout(
+        **{k: v for k, v in PLOTLY_LAYOUT.items() if k != "yaxis"},
+        title=dict(text="Temperature Range (°C)", font=dict(color="#8e8e93", size=13)),
+        yaxis=dict(**PLOTLY_LAYOUT["yaxis"], ticksuffix="°"),
+        height=280,
+    )
+    return fig
+
+
+def build_precip_fig(
+    date_labels: tuple[str, ...],
+    rain_pct: tuple[int, ...],
+    snowfall: tuple[float, ...],
+    show_snow: bool,
+) -> "go.Figure":
+    """Build the precipitation/snow chart for the displayed days."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=date_labels, y=rain_pct,
+        name="Rain %",
+        marker_color="rgba(10,132,255,0.6)",
+        marker_line_width=0,
+    ))
+    if show_snow:
+        fig.add_trace(go.Scatter(
+            x=date_labels, y=snowfall,
+            name="Snow cm",
+            mode="lines+markers",
+            line=dict(color="#ffffff", width=2),
+            marker=dict(color="#ffffff", size=5),
+            yaxis="y2",
+        ))
+        fig.update_layout(
+            yaxis2=dict(
+                overlaying="y", side="right",
+                showgrid=False, zeroline=False,
+                tickfont=dict(color="#636366"),
+                ticksuffix=" cm",
+            )
+        )
+    fig.update_layout(
+        **{k: v for k, v in PLOTLY_LAYOUT.items() if k != "yaxis"},
+        title=dict(text="Precipitation & Snow", font=dict(color="#8e8e93", size=13)),
+        yaxis=dict(**PLOTLY_LAYOUT["yaxis"], ticksuffix="%", range=[0, 100]),
+        barmode="group",
+        height=280,
+    )
+    return fig
 
 
 # ─────────────────────────────────────────────────────────────
@@ -318,15 +288,67 @@ if "daily" not in st.session_state:
     st.session_state.daily = None      # daily forecast list
 if "error" not in st.session_state:
     st.session_state.error = None
-if "forecast_days" not in st.session_state:
-    st.session_state.forecast_days = 7
+if "last_query" not in st.session_state:
+    st.session_state.last_query = None  # normalised place of the last successful fetch
+
+
+# ─────────────────────────────────────────────────────────────
+# Cached network calls — reruns with unchanged inputs skip HTTP
+# ─────────────────────────────────────────────────────────────
+# st.cache_data serves reruns in this process; the weather_alert disk cache
+# (cache_ttl=) below it lets a fresh server process reuse earlier responses.
+
+HERO_FORECAST_HOURS = 4  # hours fetched for the current-conditions card and alerts
+MAX_FORECAST_DAYS = 16  # Open-Meteo daily limit; every window option is a slice of this
+STATIC_CHART_MAX_DAYS = 7  # charts this small render as static images (no hover/zoom JS)
+
+
+@st.cache_data(ttl=GEOCODE_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_geocode(place: str) -> dict:
+    """Cached wrapper around geocode()."""
+    return geocode(place, cache_ttl=GEOCODE_CACHE_TTL_SECONDS)
+
 
+@st.cache_data(ttl=FORECAST_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_forecasts(
+    latitude: float, longitude: float, max_age: float
+) -> tuple[list[dict], list[dict]]:
+    """Fetch the hero hourly forecast and the full daily forecast together.
+
+    Both endpoints are network-bound, so they run concurrently: latency is
+    the max, not the sum. The worker threads call only the plain fetch_*
+    functions (no Streamlit APIs, which need the script thread's context);
+    caching wraps the combined result here. max_age=0 revalidates with the
+    API instead of trusting the disk cache's fresh window.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        hourly_future = pool.submit(
+            fetch_forecast,
+            latitude=latitude, longitude=longitude,
+            forecast_hours=HERO_FORECAST_HOURS, cache_ttl=max_age,
+        )
+        daily_future = pool.submit(
+            fetch_daily_forecast,
+            latitude=latitude, longitude=longitude,
+            forecast_days=MAX_FORECAST_DAYS, cache_ttl=max_age,
+        )
+    return hourly_future.result(), daily_future.result()
+
+
+def fetch_all(place: str, force: bool = False) -> None:
+    """Geocode the place and fetch the hourly and full 16-day daily forecasts.
+
+    A resubmit of the last successfully fetched place is a no-op unless
+    force is True (used by the Refresh button).
+    """
+    query = place.lower().strip()
+    if not force and query == st.session_state.last_query:
+        return
 
-def fetch_all(place: str, days: int) -> None:
-    """Geocode the place and fetch both hourly and daily forecasts."""
     st.session_state.error = None
+    st.session_state.last_query = None
     try:
-        loc = geocode(place)
+        loc = _cached_geocode(place)
     except LocationNotFoundError:
         st.session_state.error = f'Location "{place}" not found. Try a more specific name.'
         st.session_state.location = None
@@ -336,18 +358,15 @@ def fetch_all(place: str, days: int) -> None:
         return
 
     st.session_state.location = loc
+    lat = round(loc["latitude"], COORD_CACHE_PRECISION)
+    lon = round(loc["longitude"], COORD_CACHE_PRECISION)
+
+    # Refresh skips the disk cache's fresh window; unchanged data still costs only a 304
+    max_age = 0 if force else FORECAST_CACHE_TTL_SECONDS
 
     try:
-        st.session_state.hourly = fetch_forecast(
-            latitude=loc["latitude"],
-            longitude=loc["longitude"],
-            forecast_hours=4,
-        )
-        st.session_state.daily = fetch_daily_forecast(
-            latitude=loc["latitude"],
-            longitude=loc["longitude"],
-            forecast_days=days,
-        )
+        st.session_state.hourly, st.session_state.daily = _cached_forecasts(lat, lon, max_age)
+        st.session_state.last_query = query
     except RuntimeError as e:
         st.session_state.error = f"Weather API error: {e}"
         st.session_state.hourly = None
@@ -368,26 +387,25 @@ with col_c:
         label_visibility="collapsed",
         key="location_input",
     )
-    btn_col, _ = st.columns([1, 2])
+    btn_col, refresh_col, _ = st.columns([1, 1, 1])
     with btn_col:
         get_weather = st.button("Get Weather", use_container_width=True)
+    with refresh_col:
+        refresh = st.button("Refresh", use_container_width=True)
+
+    if refresh:
+        _cached_forecasts.clear()
 
-    if get_weather and location_input.strip():
-        fetch_all(location_input.strip(), st.session_state.forecast_days)
+    if (get_weather or refresh) and location_input.strip():
+        fetch_all(location_input.strip(), force=refresh)
 
     if st.session_state.location:
         loc = st.session_state.location
-        st.markdown(
-            f'<div class="location-resolved">'
-            f'📍 {loc["name"]} &nbsp;·&nbsp; '
-            f'{loc["latitude"]:.4f}°, {loc["longitude"]:.4f}°'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
+        st.markdown(_LOCATION_TEMPLATE.format_map(loc), unsafe_allow_html=True)
 
     if st.session_state.error:
         st.markdown(
-            f'<div class="error-card">⚠️ {st.session_state.error}</div>',
+            _ERROR_TEMPLATE.format(message=st.session_state.error),
             unsafe_allow_html=True,
         )
 
@@ -395,26 +413,12 @@ with col_c:
 # SECTION 2: Current conditions hero
 # ─────────────────────────────────────────────────────────────
 
-if st.session_state.hourly and not st.session_state.error:
+def _render_hero() -> None:
+    """Render the current-conditions card for the first forecast hour."""
     current = st.session_state.hourly[0]
     loc = st.session_state.location
 
-    # Evaluate alerts against a minimal config
-    mock_config = {
-        "alerts": {
-            "rain_probability_threshold": 50,
-            "wind_speed_threshold": 30,
-            "feels_like_min": 2,
-            "lookahead_hours": 3,
-            "temperature_min": 0,
-        }
-    }
-    # Try to load real config; fall back to mock
-    try:
-        from weather_alert.config import load_config
-        config = load_config()
-    except Exception:
-        config = mock_config
+    config = _get_config()
 
     alerts = evaluate_rules(st.session_state.hourly, config)
 
@@ -426,9 +430,10 @@ if st.session_state.hourly and not st.session_state.error:
     precip = current.get("precipitation_probability", 0) or 0
     snow_depth = current.get("snow_depth", 0) or 0
     code = current.get("weathercode")
+    condition = weathercode_label(code)
 
     try:
-        dt = datetime.strptime(current["time"], "%Y-%m-%dT%H:%M")
+        dt = datetime.fromisoformat(current["time"])
         time_str = dt.strftime("%A, %d %B · %H:%M")
     except (ValueError, KeyError):
         time_str = current.get("time", "")
@@ -445,7 +450,6 @@ if st.session_state.hourly and not st.session_state.error:
         )
 
     with hero_right:
-        pill_cols = st.columns(2)
         stats = [
             ("Humidity", f"{humidity}", "%"),
             ("Rain chance", f"{precip}", "%"),
@@ -454,16 +458,12 @@ if st.session_state.hourly and not st.session_state.error:
         if snow_depth > 0:
             stats.append(("Snow depth", f"{snow_depth}", "cm"))
         else:
-            stats.append(("Condition", weathercode_label(code), ""))
+            stats.append(("Condition", condition, ""))
 
-        for i, (label, val, unit) in enumerate(stats):
-            with pill_cols[i % 2]:
-                st.markdown(stat_html(label, val, unit), unsafe_allow_html=True)
+        st.markdown(stat_grid_html(stats, columns=2), unsafe_allow_html=True)
 
     st.markdown(
-        f'<div class="condition-line">'
-        f'{weathercode_label(code)} &nbsp;·&nbsp; {loc["name"]} &nbsp;·&nbsp; {time_str}'
-        f'</div>',
+        _CONDITION_TEMPLATE.format(condition=condition, name=loc["name"], time=time_str),
         unsafe_allow_html=True,
     )
 
@@ -471,19 +471,29 @@ if st.session_state.hourly and not st.session_state.error:
         alerts_text = " &nbsp;·&nbsp; ".join(
             a.split(":")[0] if ":" in a else a for a in alerts
         )
-        st.markdown(
-            f'<div class="alert-pill">⚠️ {alerts_text}</div>',
-            unsafe_allow_html=True,
-        )
+        st.markdown(_ALERT_TEMPLATE.format(text=alerts_text), unsafe_allow_html=True)
 
     st.markdown("</div>", unsafe_allow_html=True)
 
+
+if st.session_state.hourly and not st.session_state.error:
+    _render_hero()
+
 # ─────────────────────────────────────────────────────────────
 # SECTION 3 + 4 + 5: Forecast
 # ─────────────────────────────────────────────────────────────
 
-if st.session_state.daily and not st.session_state.error:
+
+@st.fragment
+def _render_forecast() -> None:
+    """Render the window selector, forecast table and charts.
+
+    Runs as a fragment, so changing the forecast window reruns only this
+    function rather than the whole page.
+    """
     daily = st.session_state.daily
+    # Read once per render; the day labels and the row highlight both use it
+    today = date.today().isoformat()
 
     # ── Forecast window selector
     st.markdown('<div class="section-label">Forecast</div>', unsafe_allow_html=True)
@@ -498,70 +508,70 @@ if st.session_state.daily and not st.session_state.error:
     )
     selected_days = window_options[selected_label]
 
-    # Re-fetch if window changed
-    if selected_days != st.session_state.forecast_days and st.session_state.location:
-        st.session_state.forecast_days = selected_days
-        loc = st.session_state.location
-        try:
-            st.session_state.daily = fetch_daily_forecast(
-                latitude=loc["latitude"],
-                longitude=loc["longitude"],
-                forecast_days=selected_days,
-            )
-            daily = st.session_state.daily
-        except RuntimeError:
-            pass
-
+    # The full 16-day forecast is already in session state — slice, don't refetch
     display_days = daily[:selected_days]
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    has_snow = any(d["snowfall_cm"] > 0 or d["snow_depth_cm"] > 0 for d in display_days)
+
+    # One pass over the days: column series for the charts plus both snow flags
+    date_labels: list[str] = []
+    temp_max: list[float] = []
+    temp_min: list[float] = []
+    rain_pct: list[int] = []
+    snowfall: list[float] = []
+    table_rows: list[dict] = []
+    has_snowfall = False
+    has_snow = False
+    # Labelled at render time so "Today" moves at midnight without a refetch;
+    # the date labels come from weather_alert.utils.fmt_day, whose lru_cache
+    # survives reruns (this script's own globals are rebuilt on each one)
+    today_row: int | None = None
+    for i, d in enumerate(display_days):
+        snow = d["snowfall_cm"]
+        label, is_today = fmt_day(d["date"], today)
+        if is_today:
+            today_row = i
+        date_labels.append(label)
+        temp_max.append(d["temp_max"])
+        temp_min.append(d["temp_min"])
+        rain_pct.append(d["rain_probability"])
+        snowfall.append(snow)
+        has_snowfall |= snow > 0
+        has_snow |= snow > 0 or d["snow_depth_cm"] > 0
+        table_rows.append({
+            "Day": label,
+            "Max °C": d["temp_max"],
+            "Min °C": d["temp_min"],
+            "Rain %": d["rain_probability"],
+            "Snow (cm)": snow,
+            "Depth (cm)": d["snow_depth_cm"],
+            "Wind km/h": f'{d["wind_max"]:.0f} {d["wind_direction"]}',
+        })
 
     # ── Forecast table
     st.markdown('<div class="wa-card">', unsafe_allow_html=True)
 
-    snow_cols = '<th>Snow (cm)</th><th>Depth (cm)</th>' if has_snow else ""
-    table_html = f"""
-    <table class="wa-table">
-      <thead>
-        <tr>
-          <th>Day</th>
-          <th>Max °C</th>
-          <th>Min °C</th>
-          <th>Rain %</th>
-          {snow_cols}
-          <th>Wind km/h</th>
-        </tr>
-      </thead>
-      <tbody>
-    """
-    for d in display_days:
-        label, is_today = fmt_day(d["date"], today_str)
-        row_class = "today" if is_today else ""
-        snow_cells = ""
-        if has_snow:
-            snow_cells = f'<td>{d["snowfall_cm"]:.1f}</td><td>{d["snow_depth_cm"]:.1f}</td>'
-        table_html += f"""
-        <tr class="{row_class}">
-          <td>{label}</td>
-          <td>{d["temp_max"]:.1f}°</td>
-          <td>{d["temp_min"]:.1f}°</td>
-          <td>{d["rain_probability"]}%</td>
-          {snow_cells}
-          <td>{d["wind_max"]:.0f} {d["wind_direction"]}</td>
-        </tr>
-        """
-    table_html += "</tbody></table>"
-    st.markdown(table_html, unsafe_allow_html=True)
+    columns = FORECAST_COLUMNS_SNOW if has_snow else FORECAST_COLUMNS
+    table = table_rows
+    if today_row is not None:
+        import pandas as pd
+
+        table = pd.DataFrame(table_rows).style.apply(
+            _today_row_styles, axis=1, today_row=today_row
+        )
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=True,
+        column_order=columns,
+        column_config=FORECAST_COLUMN_CONFIG,
+    )
     st.markdown("</div>", unsafe_allow_html=True)
 
     # ── Charts (only if > 1 day)
     if selected_days > 1:
-        dates = [d["date"] for d in display_days]
-        date_labels = [fmt_day(d, today_str)[0] for d in dates]
-        temp_max = [d["temp_max"] for d in display_days]
-        temp_min = [d["temp_min"] for d in display_days]
-        rain_pct = [d["rain_probability"] for d in display_days]
-        snowfall  = [d["snowfall_cm"] for d in display_days]
+        chart_config = {
+            "displayModeBar": False,
+            "staticPlot": selected_days <= STATIC_CHART_MAX_DAYS,
+        }
 
         # Layout: side by side if > 3 days, stacked otherwise
         if selected_days > 3:
@@ -571,65 +581,19 @@ if st.session_state.daily and not st.session_state.error:
 
         # Chart 1: Temperature range
         with chart_cols[0]:
-            fig_temp = go.Figure()
-            fig_temp.add_trace(go.Scatter(
-                x=date_labels, y=temp_max,
-                name="Max",
-                mode="lines",
-                line=dict(color="#0a84ff", width=2),
-                fill="tonexty",
-                fillcolor="rgba(10,132,255,0.08)",
-            ))
-            fig_temp.add_trace(go.Scatter(
-                x=date_labels, y=temp_min,
-                name="Min",
-                mode="lines",
-                line=dict(color="#0a84ff", width=1, dash="dot"),
-                fill="tozeroy",
-                fillcolor="rgba(10,132,255,0.04)",
-            ))
-            fig_temp.update_layout(
-                **{k: v for k, v in PLOTLY_LAYOUT.items() if k != "yaxis"},
-                title=dict(text="Temperature Range (°C)", font=dict(color="#8e8e93", size=13)),
-                yaxis=dict(**PLOTLY_LAYOUT["yaxis"], ticksuffix="°"),
-                height=280,
-            )
-            st.plotly_chart(fig_temp, use_container_width=True, config={"displayModeBar": False})
+            fig_temp = build_temp_fig(tuple(date_labels), tuple(temp_max), tuple(temp_min))
+            st.plotly_chart(fig_temp, use_container_width=True, config=chart_config)
 
         # Chart 2: Precipitation + Snow
         with chart_cols[1]:
-            fig_precip = go.Figure()
-            fig_precip.add_trace(go.Bar(
-                x=date_labels, y=rain_pct,
-                name="Rain %",
-                marker_color="rgba(10,132,255,0.6)",
-                marker_line_width=0,
-            ))
-            if any(s > 0 for s in snowfall):
-                fig_precip.add_trace(go.Scatter(
-                    x=date_labels, y=snowfall,
-                    name="Snow cm",
-                    mode="lines+markers",
-                    line=dict(color="#ffffff", width=2),
-                    marker=dict(color="#ffffff", size=5),
-                    yaxis="y2",
-                ))
-                fig_precip.update_layout(
-                    yaxis2=dict(
-                        overlaying="y", side="right",
-                        showgrid=False, zeroline=False,
-                        tickfont=dict(color="#636366"),
-                        ticksuffix=" cm",
-                    )
-                )
-            fig_precip.update_layout(
-                **{k: v for k, v in PLOTLY_LAYOUT.items() if k != "yaxis"},
-                title=dict(text="Precipitation & Snow", font=dict(color="#8e8e93", size=13)),
-                yaxis=dict(**PLOTLY_LAYOUT["yaxis"], ticksuffix="%", range=[0, 100]),
-                barmode="group",
-                height=280,
+            fig_precip = build_precip_fig(
+                tuple(date_labels), tuple(rain_pct), tuple(snowfall), has_snowfall
             )
-            st.plotly_chart(fig_precip, use_container_width=True, config={"displayModeBar": False})
+            st.plotly_chart(fig_precip, use_container_width=True, config=chart_config)
+
+
+if st.session_state.daily and not st.session_state.error:
+    _render_forecast()
 
 # ─────────────────────────────────────────────────────────────
 # Footer
@@ -12,18 +12,23 @@ Requires: pip install -e ".[ui]"
 Data source: ERA5 reanalysis via Open-Meteo Historical Weather API (free, no key).
 """
 
+import json
 import sys
 from pathlib import Path
 
-# Ensure the src/ package is importable when running from the project root
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Ensure the src/ package is importable when running from the project root.
+# Streamlit re-executes this file on every rerun, so only insert it once.
+_SRC_DIR = str(Path(__file__).parent.parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
-import argparse
+from collections.abc import Callable
 from datetime import date
+from string import Template
+from types import ModuleType
 
-import plotly.graph_objects as go
+import numpy as np
 import streamlit as st
-from plotly.subplots import make_subplots
 
 from weather_alert.analysis import (
     find_extremes,
@@ -50,222 +55,60 @@ st.set_page_config(
 
 
 # ─────────────────────────────────────────────────────────────
-# CSS injection (Apple-inspired dark theme — copied from app.py)
+# CSS injection (Apple-inspired dark theme — shared with app.py)
 # ─────────────────────────────────────────────────────────────
 
-APPLE_CSS = """
-<style>
-  /* ── Reset Streamlit chrome ── */
-  #MainMenu, footer, header { visibility: hidden; }
-  .block-container { padding-top: 2rem; padding-bottom: 4rem; max-width: 960px; }
-
-  /* ── Typography & base ── */
-  html, body, [class*="css"] {
-    font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display",
-                 "SF Pro Text", "Segoe UI", Roboto, sans-serif;
-    background-color: #0a0a0a;
-    color: #f5f5f7;
-  }
-
-  /* ── Search input ── */
-  .stTextInput > div > div > input {
-    background: #1c1c1e !important;
-    border: 1px solid #3a3a3c !important;
-    border-radius: 980px !important;
-    color: #f5f5f7 !important;
-    font-size: 1.1rem !important;
-    padding: 0.75rem 1.25rem !important;
-    text-align: center;
-  }
-  .stTextInput > div > div > input::placeholder { color: #636366 !important; }
-  .stTextInput > div > div > input:focus {
-    border-color: #0a84ff !important;
-    box-shadow: 0 0 0 3px rgba(10,132,255,0.2) !important;
-  }
-
-  /* ── Primary button ── */
-  .stButton > button {
-    background: #0a84ff !important;
-    color: #ffffff !important;
-    border: none !important;
-    border-radius: 980px !important;
-    font-size: 1rem !important;
-    font-weight: 600 !important;
-    padding: 0.6rem 2rem !important;
-    letter-spacing: -0.01em;
-    transition: opacity 0.15s ease;
-  }
-  .stButton > button:hover { opacity: 0.85; }
-  .stButton > button:active { opacity: 0.7; }
-
-  /* ── Cards ── */
-  .wa-card {
-    background: #1c1c1e;
-    border: 1px solid #2c2c2e;
-    border-radius: 16px;
-    padding: 28px 32px;
-    margin-bottom: 1.5rem;
-  }
-
-  /* ── Hero temperature ── */
-  .hero-temp {
-    font-size: 7rem;
-    font-weight: 700;
-    letter-spacing: -0.04em;
-    line-height: 1;
-    background: linear-gradient(180deg, #ffffff 60%, #8e8e93 100%);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    background-clip: text;
-  }
-  .hero-feels {
-    font-size: 1rem;
-    color: #8e8e93;
-    font-weight: 400;
-    margin-top: 0.25rem;
-    letter-spacing: -0.01em;
-  }
-
-  /* ── Stat pills ── */
-  .stat-pill {
-    background: #2c2c2e;
-    border-radius: 12px;
-    padding: 14px 18px;
-    display: inline-block;
-    width: 100%;
-  }
-  .stat-label {
-    font-size: 0.68rem;
-    text-transform: uppercase;
-    letter-spacing: 0.08em;
-    color: #8e8e93;
-    font-weight: 500;
-  }
-  .stat-value {
-    font-size: 1.6rem;
-    font-weight: 700;
-    letter-spacing: -0.03em;
-    color: #f5f5f7;
-    line-height: 1.2;
-  }
-  .stat-unit {
-    font-size: 0.9rem;
-    color: #8e8e93;
-    font-weight: 400;
-  }
-
-  /* ── Alert pill ── */
-  .alert-pill {
-    background: rgba(255, 69, 58, 0.15);
-    border: 1px solid rgba(255, 69, 58, 0.4);
-    border-radius: 8px;
-    color: #ff453a;
-    font-size: 0.9rem;
-    font-weight: 500;
-    padding: 8px 16px;
-    margin-top: 12px;
-    display: inline-block;
-  }
-
-  /* ── Error card ── */
-  .error-card {
-    background: rgba(255, 69, 58, 0.1);
-    border: 1px solid rgba(255, 69, 58, 0.3);
-    border-radius: 12px;
-    color: #ff453a;
-    font-size: 1rem;
-    padding: 20px 24px;
-    text-align: center;
-    margin: 1rem 0;
-  }
-
-  /* ── Condition line ── */
-  .condition-line {
-    color: #8e8e93;
-    font-size: 0.95rem;
-    letter-spacing: -0.01em;
-    margin-top: 1rem;
-    text-align: center;
-  }
-
-  /* ── Section heading ── */
-  .section-label {
-    font-size: 0.72rem;
-    text-transform: uppercase;
-    letter-spacing: 0.1em;
-    color: #636366;
-    font-weight: 600;
-    margin-bottom: 0.75rem;
-  }
-
-  /* ── Forecast table ── */
-  .wa-table { width: 100%; border-collapse: collapse; font-size: 0.95rem; }
-  .wa-table th {
-    font-size: 0.65rem;
-    text-transform: uppercase;
-    letter-spacing: 0.1em;
-    color: #636366;
-    font-weight: 600;
-    padding: 8px 12px;
-    text-align: right;
-    border-bottom: 1px solid #2c2c2e;
-  }
-  .wa-table th:first-child { text-align: left; }
-  .wa-table td {
-    padding: 12px 12px;
-    color: #f5f5f7;
-    text-align: right;
-    border-bottom: 1px solid #1c1c1e;
-    font-variant-numeric: tabular-nums;
-    font-weight: 500;
-  }
-  .wa-table td:first-child { text-align: left; color: #f5f5f7; }
-  .wa-table tr:hover td { background: #2c2c2e; }
-  .wa-table tr.today td { background: rgba(10,132,255,0.08); }
-  .wa-table tr.today td:first-child { color: #0a84ff; font-weight: 600; }
-
-  /* ── Segmented control (radio) ── */
-  .stRadio > div { gap: 0 !important; }
-  .stRadio > div > label {
-    background: #1c1c1e;
-    border: 1px solid #3a3a3c;
-    color: #8e8e93 !important;
-    border-radius: 0;
-    padding: 0.45rem 1.2rem;
-    font-size: 0.9rem;
-    font-weight: 500;
-    cursor: pointer;
-    margin: 0 !important;
-    transition: all 0.15s;
-  }
-  .stRadio > div > label:first-child { border-radius: 8px 0 0 8px; }
-  .stRadio > div > label:last-child  { border-radius: 0 8px 8px 0; border-left: none; }
-  .stRadio > div > label[data-checked="true"] {
-    background: #0a84ff !important;
-    border-color: #0a84ff !important;
-    color: #ffffff !important;
-  }
-
-  /* ── Location resolved text ── */
-  .location-resolved {
-    color: #8e8e93;
-    font-size: 0.85rem;
-    text-align: center;
-    margin-top: 0.5rem;
-  }
-
-  /* ── Footer ── */
-  .wa-footer {
-    text-align: center;
-    color: #48484a;
-    font-size: 0.8rem;
-    padding: 3rem 0 1rem;
-    letter-spacing: -0.005em;
-  }
-</style>
-"""
+THEME_CSS_PATH = Path(__file__).parent / "static" / "theme.css"
+
+
+@st.cache_resource
+def load_custom_css() -> str:
+    """Read the dashboard theme once per server process and wrap it in <style>."""
+    return f"<style>\n{THEME_CSS_PATH.read_text(encoding='utf-8')}</style>"
 
-st.markdown(APPLE_CSS, unsafe_allow_html=True)
+
+st.markdown(load_custom_css(), unsafe_allow_html=True)
+
+
+# ─────────────────────────────────────────────────────────────
+# Static HTML blobs (one definition each, shared by every section using them)
+# ─────────────────────────────────────────────────────────────
+
+SPACER_HTML = "<div style='height:1rem'></div>"
+SECTION_GAP_HTML = "<div style='height:1.5rem'></div>"
+
+SECTION_LABELS: dict[str, str] = {
+    key: f'<div class="section-label">{text}</div>'
+    for key, text in (
+        ("trend", "Annual Temperature Trend"),
+        ("precip", "Precipitation &amp; Snow"),
+        ("climatology", "Monthly Climatology"),
+        ("extremes", "Extreme Years"),
+    )
+}
+
+EMPTY_STATE_HTML = (
+    '<div class="condition-line" style="margin-top:3rem;">'
+    "Enter a location above and click Analyse History"
+    "</div>"
+)
+
+_FOOTER_CREDIT = (
+    'Powered by <a href="https://open-meteo.com" style="color:#0a84ff;'
+    'text-decoration:none;">Open-Meteo</a> Historical Weather API'
+    " &nbsp;·&nbsp; ERA5 reanalysis &nbsp;·&nbsp; No API key required"
+)
+FOOTER_HTML = f'<div class="wa-footer">{_FOOTER_CREDIT}</div>'
+FOOTER_TMPL = Template(
+    f'<div class="wa-footer">{_FOOTER_CREDIT}'
+    " &nbsp;·&nbsp; $n_years years of data ($start_yr–$end_yr)</div>"
+)
+
+ERROR_TMPL = Template('<div class="error-card">⚠️ $message</div>')
+HEADER_TMPL = Template(
+    '<h2 style="font-size:1.6rem;font-weight:700;letter-spacing:-0.03em;'
+    'margin-bottom:0.25rem;">📅 $name</h2>'
+)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -286,6 +129,53 @@ PLOTLY_LAYOUT = dict(
     yaxis=dict(gridcolor="#2c2c2e", zeroline=False, tickfont=dict(color="#636366")),
 )
 
+_TITLE_FONT = dict(color="#8e8e93", size=13)
+
+
+def _unit_layout(ticksuffix: str = "") -> dict:
+    """Return PLOTLY_LAYOUT with an auto-ranged y-axis carrying ticksuffix."""
+    yaxis = {**PLOTLY_LAYOUT["yaxis"], "autorange": True, "rangemode": "normal"}
+    if ticksuffix:
+        yaxis["ticksuffix"] = ticksuffix
+    return {**PLOTLY_LAYOUT, "yaxis": yaxis}
+
+
+# Per-unit layout variants, shared by every chart plotting that unit
+LAYOUT_TEMP = _unit_layout("°C")
+LAYOUT_MM = _unit_layout(" mm")
+LAYOUT_PCT = _unit_layout("%")
+LAYOUT_DUAL = _unit_layout()  # dual-axis charts set suffixes via update_yaxes
+
+
+def _lazy_plotly() -> tuple[ModuleType, Callable]:
+    """Import Plotly on first use and return (graph_objects, make_subplots).
+
+    Plotly is only needed once a query has been submitted, so the landing
+    screen does not pay its import cost. Later calls are sys.modules lookups.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    return go, make_subplots
+
+
+@st.cache_resource(show_spinner=False)
+def _secondary_y_axes() -> dict:
+    """Axis wiring of make_subplots(specs=[[{"secondary_y": True}]]), built once.
+
+    Dual-axis charts start from go.Figure(layout=...) and route secondary
+    traces with yaxis="y2", skipping the subplot builder and its template copy
+    per chart.
+    """
+    _, make_subplots = _lazy_plotly()
+    layout = make_subplots(specs=[[{"secondary_y": True}]]).to_dict()["layout"]
+    return {k: v for k, v in layout.items() if k != "template"}
+
+
+def _titled(layout: dict, text: str, height: int, **extra) -> dict:
+    """Shallow-copy a layout variant with its chart title and height set."""
+    return {**layout, "title": dict(text=text, font=_TITLE_FONT), "height": height, **extra}
+
 
 # ─────────────────────────────────────────────────────────────
 # Helpers
@@ -303,15 +193,14 @@ def stat_html(label: str, value: str, unit: str = "") -> str:
 
 
 def _fmt_date(d: date | None) -> str:
-    """Format a date as '%-d %b %Y' (or '%#d %b %Y' on Windows), returning '—' for None."""
-    import sys
+    """Format a date as e.g. '3 Jan 2021', returning '—' for None.
+
+    Built from _MONTH_ABBR rather than strftime, which needs the
+    platform-specific '%-d' / '%#d' for an unpadded day.
+    """
     if d is None:
         return "—"
-    try:
-        day_fmt = "%-d" if sys.platform != "win32" else "%#d"
-        return d.strftime(f"{day_fmt} %b %Y")
-    except Exception:
-        return str(d)
+    return f"{d.day} {_MONTH_ABBR[d.month]} {d.year}"
 
 
 # ─────────────────────────────────────────────────────────────
@@ -319,25 +208,39 @@ def _fmt_date(d: date | None) -> str:
 # ─────────────────────────────────────────────────────────────
 
 
+DEFAULT_HISTORY_YEARS = 30
+
+
+@st.cache_resource(show_spinner=False)
 def _parse_cli_args() -> tuple[str | None, int]:
     """Parse --location and --years from sys.argv after the '--' separator.
 
-    Streamlit passes everything after '--' as script arguments.
+    Streamlit passes everything after '--' as script arguments. The result is
+    cached with st.cache_resource because Streamlit re-executes this module on
+    every rerun (which would reset a functools cache) while argv never changes.
+    Unknown flags and a non-integer --years are ignored.
+
     Returns (location_str | None, years_int).
     """
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("--location", type=str, default=None)
-    parser.add_argument("--years", type=int, default=30)
-
-    # Streamlit forwards argv after '--'; gracefully ignore unknown flags
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    values: dict[str, str] = {}
+    it = iter(argv)
+    for arg in it:
+        flag, eq, value = arg.partition("=")
+        if flag not in ("--location", "--years"):
+            continue
+        if not eq:
+            value = next(it, None)
+            if value is None:
+                break
+        values[flag] = value
+
+    location = values.get("--location")
     try:
-        sep = sys.argv.index("--")
-        script_args = sys.argv[sep + 1:]
+        years = int(values.get("--years", DEFAULT_HISTORY_YEARS))
     except ValueError:
-        script_args = []
-
-    args, _ = parser.parse_known_args(script_args)
-    return args.location, args.years
+        years = DEFAULT_HISTORY_YEARS
+    return location, years
 
 
 CLI_LOCATION, CLI_YEARS = _parse_cli_args()
@@ -353,8 +256,12 @@ def load_data(location: str, years: int) -> dict:
     """Geocode *location*, fetch historical data, run all analysis passes.
 
     Returns a dict with keys:
-        location (dict), records (list[dict]), yearly (list[dict]),
-        monthly (list[dict]), trend (dict), extremes (dict)
+        location (dict), yearly (list[dict]), monthly (list[dict]),
+        seasonal (dict), humidity (list[dict]), trend (dict), extremes (dict)
+
+    The raw daily records are reduced here and not returned: Streamlit
+    pickles the cached payload on every hit, and ~27k daily dicts would
+    dominate that cost while the UI only needs the aggregates.
 
     On any error returns {"error": str}.
     """
@@ -384,9 +291,10 @@ def load_data(location: str, years: int) -> dict:
 
     return {
         "location": loc,
-        "records": records,
         "yearly": yearly,
         "monthly": monthly,
+        "seasonal": seasonal_breakdown(records),
+        "humidity": yearly_humidity(records),
         "trend": trend,
         "extremes": extremes,
     }
@@ -396,177 +304,75 @@ def load_data(location: str, years: int) -> dict:
 # Main dashboard
 # ─────────────────────────────────────────────────────────────
 
-_MONTH_ABBR = [
-    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
-]
-
-
-def main() -> None:
-    """Render the full historical weather dashboard."""
-
-    # ── SECTION 1: Input row ─────────────────────────────────
-
-    st.markdown("<div style='height:1rem'></div>", unsafe_allow_html=True)
-
-    col_l, col_c, col_r = st.columns([1, 2, 1])
-    with col_c:
-        location_input = st.text_input(
-            label="location",
-            value=CLI_LOCATION or "",
-            placeholder="Enter a location (e.g. Soldeu, Andorra)",
-            label_visibility="collapsed",
-            key="hist_location_input",
-        )
-        years_col, btn_col = st.columns([1, 2])
-        with years_col:
-            years_input = st.number_input(
-                label="Years of history",
-                min_value=1,
-                max_value=75,
-                value=CLI_YEARS,
-                step=5,
-                label_visibility="collapsed",
-                key="hist_years_input",
-                help="Years of history to analyse (max ~75 for ERA5)",
-            )
-        with btn_col:
-            analyse_clicked = st.button(
-                "Analyse History", use_container_width=True, key="hist_analyse_btn"
-            )
-
-    # Determine the active query: button press overrides CLI default
-    query_location: str | None = None
-    if analyse_clicked and location_input.strip():
-        query_location = location_input.strip()
-    elif CLI_LOCATION and not analyse_clicked:
-        # Auto-load when launched with --location flag
-        query_location = CLI_LOCATION
-
-    if query_location is None:
-        st.markdown(
-            '<div class="condition-line" style="margin-top:3rem;">'
-            "Enter a location above and click Analyse History"
-            "</div>",
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            '<div class="wa-footer">'
-            'Powered by <a href="https://open-meteo.com" style="color:#0a84ff;'
-            'text-decoration:none;">Open-Meteo</a> Historical Weather API'
-            " &nbsp;·&nbsp; ERA5 reanalysis &nbsp;·&nbsp; No API key required"
-            "</div>",
-            unsafe_allow_html=True,
-        )
-        return
-
-    # ── SECTION 2: Spinner while loading ────────────────────
-
-    with st.spinner(f"Loading {int(years_input)}-year history for {query_location}…"):
-        data = load_data(query_location, int(years_input))
+CHART_CONFIG = {"displayModeBar": False}
 
-    if "error" in data:
-        st.markdown(
-            f'<div class="error-card">⚠️ {data["error"]}</div>',
-            unsafe_allow_html=True,
-        )
-        return
-
-    loc: dict = data["location"]
-    yearly: list[dict] = data["yearly"]
-    monthly: list[dict] = data["monthly"]
-    trend: dict = data["trend"]
-    extremes: dict = data["extremes"]
-
-    if not yearly:
-        st.markdown(
-            '<div class="error-card">⚠️ No yearly data available.</div>',
-            unsafe_allow_html=True,
-        )
-        return
+# Yearly-summary fields the charts read, extracted once per render
+YEARLY_COLUMNS = ("year", "avg_temp_mean", "total_precipitation", "total_snowfall", "snow_days")
 
-    n_years = len(yearly)
-    start_yr = yearly[0]["year"]
-    end_yr = yearly[-1]["year"]
-    all_means = [y["avg_temp_mean"] for y in yearly]
-    overall_mean = round(sum(all_means) / n_years, 1)
+# Indexed directly by month number (1-12); slot 0 is a placeholder
+_MONTH_ABBR = (
+    "", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
 
-    # ── SECTION 3: Page header + compact summary ─────────────
 
-    trend_sign = "+" if trend["slope_per_decade"] >= 0 else ""
-    trend_color = (
+def _trend_style(trend: dict) -> tuple[str, str]:
+    """Return the (sign prefix, line colour) used to display a temperature trend."""
+    sign = "+" if trend["slope_per_decade"] >= 0 else ""
+    color = (
         "#ff453a" if trend["label"] == "warming"
         else "#30d158" if trend["label"] == "cooling"
         else "#8e8e93"
     )
+    return sign, color
 
-    st.markdown(
-        f'<h2 style="font-size:1.6rem;font-weight:700;letter-spacing:-0.03em;'
-        f'margin-bottom:0.25rem;">📅 {loc["name"]}</h2>',
-        unsafe_allow_html=True,
-    )
 
-    # Build compact summary text
-    _divider = "─" * 49
-
-    def _mon_year(d: date | None) -> str:
-        if d is None:
-            return "—"
-        try:
-            return d.strftime("%b %Y")
-        except Exception:
-            return str(d)
-
-    hottest_temp = extremes.get("hottest_year_max_temp", "—")
-    coldest_temp = extremes.get("coldest_year_min_temp", "—")
-    hottest_mon = _mon_year(extremes.get("hottest_date"))
-    coldest_mon = _mon_year(extremes.get("coldest_date"))
-    wettest_yr = extremes.get("wettest_year", "—")
-    wettest_mm = extremes.get("wettest_year_precip", "—")
-    driest_yr = extremes.get("driest_year", "—")
-    driest_mm = extremes.get("driest_year_precip", "—")
-    snowiest_yr = extremes.get("snowiest_year", "—")
-    snowiest_cm = extremes.get("snowiest_year_snowfall", "—")
-    avg_snow_days = round(sum(y["snow_days"] for y in yearly) / n_years, 1)
+def _yearly_columns(yearly: list[dict]) -> dict[str, np.ndarray]:
+    """Extract YEARLY_COLUMNS from the yearly dicts into float64 arrays (AoS → SoA)."""
+    n = len(yearly)
+    return {
+        k: np.fromiter((y[k] for y in yearly), dtype=np.float64, count=n)
+        for k in YEARLY_COLUMNS
+    }
 
-    summary_lines = [
-        f"📍 {loc['name']} — {n_years}-year Analysis ({start_yr}–{end_yr})",
-        _divider,
-        f"Avg temp: {overall_mean}°C · Trend: {trend_sign}{trend['slope_per_decade']}°C/decade ({trend['label']})",
-        f"Hottest: {hottest_temp}°C ({hottest_mon}) · Coldest: {coldest_temp}°C ({coldest_mon})",
-        f"Wettest: {wettest_yr} ({wettest_mm}mm) · Driest: {driest_yr} ({driest_mm}mm)",
-        f"Snowiest: {snowiest_yr} ({snowiest_cm}cm) · Snow days: avg {avg_snow_days}/year",
-        _divider,
-    ]
-    st.code("\n".join(summary_lines), language=None)
 
-    st.markdown("<div style='height:1.5rem'></div>", unsafe_allow_html=True)
+@st.cache_data(ttl=86400)
+def _build_figures(location: str, years: int) -> dict[str, str]:
+    """Build every history chart for a successful load_data() result.
+
+    Keyed like load_data(), so widget interactions that rerun the script
+    without a new query reuse the serialised figures instead of redoing the
+    trend fit and Plotly layout work over the aggregated yearly and monthly
+    data. Figures are cached as Plotly JSON strings, which pickle far
+    cheaper than Figure objects.
+
+    Returns:
+        Mapping of chart key ('trend', 'precip', 'snow', 'clim', and
+        'seasonal' / 'humidity' when that data exists) to figure JSON.
+    """
+    data = load_data(location, years)
+    yearly: list[dict] = data["yearly"]
+    monthly: list[dict] = data["monthly"]
+    trend: dict = data["trend"]
+    n_years = len(yearly)
+    cols = _yearly_columns(yearly)
+    trend_sign, trend_color = _trend_style(trend)
+    go, _ = _lazy_plotly()
+    figures: dict[str, str] = {}
 
-    # ── SECTION 4: Temperature trend chart ───────────────────
+    # ── Temperature trend chart ─────────────────────────────
 
-    st.markdown(
-        '<div class="section-label">Annual Temperature Trend</div>',
-        unsafe_allow_html=True,
-    )
+    years_x = cols["year"]
+    means_y = cols["avg_temp_mean"]
 
-    years_x = [float(y["year"]) for y in yearly]
-    means_y = [y["avg_temp_mean"] for y in yearly]
-
-    # Compute OLS trend line inline for the overlay
-    n = len(years_x)
-    sum_x = sum(years_x)
-    sum_y = sum(means_y)
-    sum_xy = sum(x * y for x, y in zip(years_x, means_y))
-    sum_x2 = sum(x * x for x in years_x)
-    denom = n * sum_x2 - sum_x ** 2
-    if denom != 0:
-        slope = (n * sum_xy - sum_x * sum_y) / denom
-        intercept = (sum_y - slope * sum_x) / n
-        trend_line_y = [slope * x + intercept for x in years_x]
+    # Least-squares trend line for the overlay (needs at least two years)
+    if n_years >= 2:
+        slope, intercept = np.polyfit(years_x, means_y, 1)
+        trend_line_y = slope * years_x + intercept
     else:
-        trend_line_y = means_y[:]
+        trend_line_y = means_y.copy()
 
-    year_labels = [str(y["year"]) for y in yearly]
+    year_labels = cols["year"].astype(int).astype(str).tolist()
     trend_label_str = (
         f"{trend_sign}{trend['slope_per_decade']}°C / decade ({trend['label']})"
     )
@@ -593,20 +399,14 @@ def main() -> None:
             line=dict(color=trend_color, width=1.5, dash="dot"),
         )
     )
-    fig_trend.update_layout(**{
-        **PLOTLY_LAYOUT,
-        "title": dict(text="Mean Annual Temperature (°C)", font=dict(color="#8e8e93", size=13)),
-        "yaxis": dict(autorange=True, rangemode="normal", ticksuffix="°C"),
-        "height": 300,
-        "hovermode": "x unified",
-    })
-    st.plotly_chart(fig_trend, use_container_width=True, config={"displayModeBar": False})
-
-    # ── SECTION 5: Seasonal Trends ────────────────────────────
+    fig_trend.update_layout(
+        **_titled(LAYOUT_TEMP, "Mean Annual Temperature (°C)", 300, hovermode="x unified")
+    )
+    figures["trend"] = fig_trend.to_json()
 
-    st.subheader("SEASONAL TRENDS")
+    # ── Seasonal Trends ─────────────────────────────────────
 
-    seasonal_data = seasonal_breakdown(data["records"])
+    seasonal_data = data["seasonal"]
     if seasonal_data:
         season_years = sorted(seasonal_data.keys())
         season_year_labels = [str(y) for y in season_years]
@@ -634,111 +434,78 @@ def main() -> None:
                     marker=dict(color=season_color, size=4),
                 )
             )
-        fig_seasonal.update_layout(**{
-            **PLOTLY_LAYOUT,
-            "title": dict(
-                text="Seasonal Temperature Trends",
-                font=dict(color="#8e8e93", size=13),
-            ),
-            "yaxis": dict(autorange=True, rangemode="normal", ticksuffix="°C"),
-            "height": 320,
-            "hovermode": "x unified",
-        })
-        st.plotly_chart(fig_seasonal, use_container_width=True, config={"displayModeBar": False})
-
-    # ── SECTION 6: Precipitation + Snow (side-by-side) ───────
-
-    st.markdown(
-        '<div class="section-label">Precipitation &amp; Snow</div>',
-        unsafe_allow_html=True,
-    )
+        fig_seasonal.update_layout(
+            **_titled(LAYOUT_TEMP, "Seasonal Temperature Trends", 320, hovermode="x unified")
+        )
+        figures["seasonal"] = fig_seasonal.to_json()
 
-    precip_col, snow_col = st.columns(2)
+    # ── Precipitation + Snow (side-by-side) ─────────────────
 
     # Annual precipitation bar chart
-    with precip_col:
-        total_precips = [y["total_precipitation"] for y in yearly]
-        fig_precip = go.Figure(
-            go.Bar(
-                x=year_labels,
-                y=total_precips,
-                name="Total Precipitation",
-                marker_color="rgba(10,132,255,0.7)",
-                marker_line_width=0,
-            )
-        )
-        fig_precip.update_layout(**{
-            **PLOTLY_LAYOUT,
-            "title": dict(text="Annual Precipitation (mm)", font=dict(color="#8e8e93", size=13)),
-            "yaxis": dict(autorange=True, rangemode="normal", ticksuffix=" mm"),
-            "height": 280,
-        })
-        st.plotly_chart(
-            fig_precip, use_container_width=True, config={"displayModeBar": False}
+    total_precips = cols["total_precipitation"]
+    fig_precip = go.Figure(
+        go.Bar(
+            x=year_labels,
+            y=total_precips,
+            name="Total Precipitation",
+            marker_color="rgba(10,132,255,0.7)",
+            marker_line_width=0,
         )
+    )
+    fig_precip.update_layout(**_titled(LAYOUT_MM, "Annual Precipitation (mm)", 280))
+    figures["precip"] = fig_precip.to_json()
 
     # Annual snowfall + snow days (dual-axis)
-    with snow_col:
-        total_snowfalls = [y["total_snowfall"] for y in yearly]
-        snow_days_list = [y["snow_days"] for y in yearly]
+    total_snowfalls = cols["total_snowfall"]
+    snow_days_list = cols["snow_days"]
 
-        fig_snow = make_subplots(specs=[[{"secondary_y": True}]])
-        fig_snow.add_trace(
-            go.Bar(
-                x=year_labels,
-                y=total_snowfalls,
-                name="Snowfall (cm)",
-                marker_color="rgba(255,255,255,0.25)",
-                marker_line_width=0,
-            ),
-            secondary_y=False,
+    fig_snow = go.Figure(layout=_secondary_y_axes())
+    fig_snow.add_trace(
+        go.Bar(
+            x=year_labels,
+            y=total_snowfalls,
+            name="Snowfall (cm)",
+            marker_color="rgba(255,255,255,0.25)",
+            marker_line_width=0,
         )
-        fig_snow.add_trace(
-            go.Scatter(
-                x=year_labels,
-                y=snow_days_list,
-                name="Snow Days",
-                mode="lines+markers",
-                line=dict(color="#ffffff", width=1.5),
-                marker=dict(color="#ffffff", size=3),
-            ),
-            secondary_y=True,
+    )
+    fig_snow.add_trace(
+        go.Scatter(
+            x=year_labels,
+            y=snow_days_list,
+            name="Snow Days",
+            mode="lines+markers",
+            line=dict(color="#ffffff", width=1.5),
+            marker=dict(color="#ffffff", size=3),
+            yaxis="y2",
         )
-        fig_snow.update_layout(**{
-            **PLOTLY_LAYOUT,
-            "title": dict(
-                text="Annual Snowfall & Snow Days",
-                font=dict(color="#8e8e93", size=13),
-            ),
-            "yaxis": dict(autorange=True, rangemode="normal"),
-            "height": 280,
-            "barmode": "overlay",
-        })
-        fig_snow.update_yaxes(
+    )
+    fig_snow.update_layout(
+        **_titled(LAYOUT_DUAL, "Annual Snowfall & Snow Days", 280, barmode="overlay")
+    )
+    fig_snow.update_layout(
+        yaxis=dict(
             ticksuffix=" cm",
             gridcolor="#2c2c2e",
             zeroline=False,
             tickfont=dict(color="#636366"),
             autorange=True,
             rangemode="normal",
-            secondary_y=False,
-        )
-        fig_snow.update_yaxes(
+        ),
+        yaxis2=dict(
             ticksuffix=" d",
             showgrid=False,
             zeroline=False,
             tickfont=dict(color="#636366"),
             autorange=True,
             rangemode="normal",
-            secondary_y=True,
-        )
-        st.plotly_chart(
-            fig_snow, use_container_width=True, config={"displayModeBar": False}
-        )
+        ),
+    )
+    figures["snow"] = fig_snow.to_json()
 
     # ── Humidity chart (full-width, after precip + snow) ─────
 
-    humidity_data = yearly_humidity(data["records"])
+    humidity_data = data["humidity"]
     if humidity_data:
         humidity_years = [str(h["year"]) for h in humidity_data]
         humidity_values = [h["avg_humidity"] for h in humidity_data]
@@ -766,30 +533,18 @@ def main() -> None:
                 marker_line_width=0,
             )
         )
-        fig_humidity.update_layout(**{
-            **PLOTLY_LAYOUT,
-            "title": dict(
-                text="Average Annual Humidity (%)",
-                font=dict(color="#8e8e93", size=13),
-            ),
-            "yaxis": dict(autorange=True, rangemode="normal", ticksuffix="%"),
-            "height": 280,
-        })
-        st.plotly_chart(fig_humidity, use_container_width=True, config={"displayModeBar": False})
+        fig_humidity.update_layout(**_titled(LAYOUT_PCT, "Average Annual Humidity (%)", 280))
+        figures["humidity"] = fig_humidity.to_json()
 
-    # ── SECTION 7: Monthly climatology ───────────────────────
-
-    st.markdown(
-        '<div class="section-label">Monthly Climatology</div>',
-        unsafe_allow_html=True,
-    )
+    # ── Monthly climatology ─────────────────────────────────
 
-    month_names = [_MONTH_ABBR[m["month"] - 1] for m in monthly]
+    abbr = _MONTH_ABBR
+    month_names = [abbr[m["month"]] for m in monthly]
     clim_temps = [m["avg_temp_mean"] for m in monthly]
     clim_precips = [m["avg_precipitation"] for m in monthly]
     clim_snowfalls = [m["avg_snowfall"] for m in monthly]
 
-    fig_clim = make_subplots(specs=[[{"secondary_y": True}]])
+    fig_clim = go.Figure(layout=_secondary_y_axes())
     fig_clim.add_trace(
         go.Bar(
             x=month_names,
@@ -797,8 +552,7 @@ def main() -> None:
             name="Avg Precip (mm)",
             marker_color="rgba(10,132,255,0.55)",
             marker_line_width=0,
-        ),
-        secondary_y=False,
+        )
     )
     if any(s > 0 for s in clim_snowfalls):
         fig_clim.add_trace(
@@ -808,8 +562,7 @@ def main() -> None:
                 name="Avg Snowfall (cm)",
                 marker_color="rgba(255,255,255,0.3)",
                 marker_line_width=0,
-            ),
-            secondary_y=False,
+            )
         )
     fig_clim.add_trace(
         go.Scatter(
@@ -819,47 +572,190 @@ def main() -> None:
             mode="lines+markers",
             line=dict(color="#ff9f0a", width=2),
             marker=dict(color="#ff9f0a", size=5),
-        ),
-        secondary_y=True,
+            yaxis="y2",
+        )
     )
-    fig_clim.update_layout(**{
-        **PLOTLY_LAYOUT,
-        "title": dict(
-            text="Average Monthly Conditions (all years)",
-            font=dict(color="#8e8e93", size=13),
-        ),
-        "yaxis": dict(autorange=True, rangemode="normal"),
-        "barmode": "group",
-        "height": 300,
-    })
-    fig_clim.update_yaxes(
-        ticksuffix=" mm",
-        gridcolor="#2c2c2e",
-        zeroline=False,
-        tickfont=dict(color="#636366"),
-        autorange=True,
-        rangemode="normal",
-        secondary_y=False,
+    fig_clim.update_layout(
+        **_titled(LAYOUT_DUAL, "Average Monthly Conditions (all years)", 300, barmode="group")
     )
-    fig_clim.update_yaxes(
-        ticksuffix="°C",
-        showgrid=False,
-        zeroline=False,
-        tickfont=dict(color="#636366"),
-        autorange=True,
-        rangemode="normal",
-        secondary_y=True,
+    fig_clim.update_layout(
+        yaxis=dict(
+            ticksuffix=" mm",
+            gridcolor="#2c2c2e",
+            zeroline=False,
+            tickfont=dict(color="#636366"),
+            autorange=True,
+            rangemode="normal",
+        ),
+        yaxis2=dict(
+            ticksuffix="°C",
+            showgrid=False,
+            zeroline=False,
+            tickfont=dict(color="#636366"),
+            autorange=True,
+            rangemode="normal",
+        ),
     )
-    st.plotly_chart(fig_clim, use_container_width=True, config={"displayModeBar": False})
+    figures["clim"] = fig_clim.to_json()
 
-    # ── SECTION 7: Extreme events table ──────────────────────
+    return figures
 
-    st.markdown(
-        '<div class="section-label">Extreme Years</div>',
-        unsafe_allow_html=True,
-    )
 
-    import pandas as pd  # local import — pandas is optional/heavy
+def main() -> None:
+    """Render the full historical weather dashboard."""
+
+    # ── SECTION 1: Input row ─────────────────────────────────
+
+    st.markdown(SPACER_HTML, unsafe_allow_html=True)
+
+    col_l, col_c, col_r = st.columns([1, 2, 1])
+    with col_c:
+        location_input = st.text_input(
+            label="location",
+            value=CLI_LOCATION or "",
+            placeholder="Enter a location (e.g. Soldeu, Andorra)",
+            label_visibility="collapsed",
+            key="hist_location_input",
+        )
+        years_col, btn_col = st.columns([1, 2])
+        with years_col:
+            years_input = st.number_input(
+                label="Years of history",
+                min_value=1,
+                max_value=75,
+                value=CLI_YEARS,
+                step=5,
+                label_visibility="collapsed",
+                key="hist_years_input",
+                help="Years of history to analyse (max ~75 for ERA5)",
+            )
+        with btn_col:
+            analyse_clicked = st.button(
+                "Analyse History", use_container_width=True, key="hist_analyse_btn"
+            )
+
+    # Determine the active query: button press overrides CLI default
+    query_location: str | None = None
+    if analyse_clicked and location_input.strip():
+        query_location = location_input.strip()
+    elif CLI_LOCATION and not analyse_clicked:
+        # Auto-load when launched with --location flag
+        query_location = CLI_LOCATION
+
+    if query_location is None:
+        st.markdown(EMPTY_STATE_HTML + FOOTER_HTML, unsafe_allow_html=True)
+        return
+
+    # ── SECTION 2: Spinner while loading ────────────────────
+
+    with st.spinner(f"Loading {int(years_input)}-year history for {query_location}…"):
+        data = load_data(query_location, int(years_input))
+
+    if "error" in data:
+        st.markdown(ERROR_TMPL.substitute(message=data["error"]), unsafe_allow_html=True)
+        return
+
+    loc: dict = data["location"]
+    yearly: list[dict] = data["yearly"]
+    trend: dict = data["trend"]
+    extremes: dict = data["extremes"]
+
+    if not yearly:
+        st.markdown(
+            ERROR_TMPL.substitute(message="No yearly data available."),
+            unsafe_allow_html=True,
+        )
+        return
+
+    n_years = len(yearly)
+    start_yr = yearly[0]["year"]
+    end_yr = yearly[-1]["year"]
+
+    cols = _yearly_columns(yearly)
+    overall_mean = round(float(cols["avg_temp_mean"].mean()), 1)
+
+    # ── SECTION 3: Page header + compact summary ─────────────
+
+    trend_sign, _ = _trend_style(trend)
+
+    st.markdown(HEADER_TMPL.substitute(name=loc["name"]), unsafe_allow_html=True)
+
+    # Build compact summary text
+    _divider = "─" * 49
+
+    def _mon_year(d: date | None) -> str:
+        if d is None:
+            return "—"
+        return f"{_MONTH_ABBR[d.month]} {d.year}"
+
+    hottest_temp = extremes.get("hottest_year_max_temp", "—")
+    coldest_temp = extremes.get("coldest_year_min_temp", "—")
+    hottest_mon = _mon_year(extremes.get("hottest_date"))
+    coldest_mon = _mon_year(extremes.get("coldest_date"))
+    wettest_yr = extremes.get("wettest_year", "—")
+    wettest_mm = extremes.get("wettest_year_precip", "—")
+    driest_yr = extremes.get("driest_year", "—")
+    driest_mm = extremes.get("driest_year_precip", "—")
+    snowiest_yr = extremes.get("snowiest_year", "—")
+    snowiest_cm = extremes.get("snowiest_year_snowfall", "—")
+    avg_snow_days = round(float(cols["snow_days"].mean()), 1)
+
+    summary_lines = [
+        f"📍 {loc['name']} — {n_years}-year Analysis ({start_yr}–{end_yr})",
+        _divider,
+        f"Avg temp: {overall_mean}°C · Trend: {trend_sign}{trend['slope_per_decade']}°C/decade ({trend['label']})",
+        f"Hottest: {hottest_temp}°C ({hottest_mon}) · Coldest: {coldest_temp}°C ({coldest_mon})",
+        f"Wettest: {wettest_yr} ({wettest_mm}mm) · Driest: {driest_yr} ({driest_mm}mm)",
+        f"Snowiest: {snowiest_yr} ({snowiest_cm}cm) · Snow days: avg {avg_snow_days}/year",
+        _divider,
+    ]
+    st.code("\n".join(summary_lines), language=None)
+
+    # ── SECTION 4: Temperature trend chart ───────────────────
+
+    st.markdown(SECTION_GAP_HTML + SECTION_LABELS["trend"], unsafe_allow_html=True)
+
+    figures = _build_figures(query_location, int(years_input))
+    st.plotly_chart(json.loads(figures["trend"]), use_container_width=True, config=CHART_CONFIG)
+
+    # ── SECTION 5: Seasonal Trends ────────────────────────────
+
+    st.subheader("SEASONAL TRENDS")
+
+    if "seasonal" in figures:
+        st.plotly_chart(
+            json.loads(figures["seasonal"]), use_container_width=True, config=CHART_CONFIG
+        )
+
+    # ── SECTION 6: Precipitation + Snow (side-by-side) ───────
+
+    st.markdown(SECTION_LABELS["precip"], unsafe_allow_html=True)
+
+    precip_col, snow_col = st.columns(2)
+    with precip_col:
+        st.plotly_chart(
+            json.loads(figures["precip"]), use_container_width=True, config=CHART_CONFIG
+        )
+    with snow_col:
+        st.plotly_chart(
+            json.loads(figures["snow"]), use_container_width=True, config=CHART_CONFIG
+        )
+
+    # ── Humidity chart (full-width, after precip + snow) ─────
+
+    if "humidity" in figures:
+        st.plotly_chart(
+            json.loads(figures["humidity"]), use_container_width=True, config=CHART_CONFIG
+        )
+
+    # ── SECTION 7: Monthly climatology ───────────────────────
+
+    st.markdown(SECTION_LABELS["climatology"], unsafe_allow_html=True)
+
+    st.plotly_chart(json.loads(figures["clim"]), use_container_width=True, config=CHART_CONFIG)
+    # ── SECTION 7: Extreme events table ──────────────────────
+
+    st.markdown(SECTION_LABELS["extremes"], unsafe_allow_html=True)
 
     extremes_rows = [
         {
@@ -906,9 +802,9 @@ def main() -> None:
         },
     ]
 
-    df_extremes = pd.DataFrame(extremes_rows)
+    # st.dataframe takes the list of dicts directly — no DataFrame needed
     st.dataframe(
-        df_extremes,
+        extremes_rows,
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -922,12 +818,7 @@ def main() -> None:
     # ── SECTION 8: Footer ─────────────────────────────────────
 
     st.markdown(
-        '<div class="wa-footer">'
-        'Powered by <a href="https://open-meteo.com" style="color:#0a84ff;'
-        'text-decoration:none;">Open-Meteo</a> Historical Weather API'
-        " &nbsp;·&nbsp; ERA5 reanalysis &nbsp;·&nbsp; No API key required"
-        f" &nbsp;·&nbsp; {n_years} years of data ({start_yr}–{end_yr})"
-        "</div>",
+        FOOTER_TMPL.substitute(n_years=n_years, start_yr=start_yr, end_yr=end_yr),
         unsafe_allow_html=True,
     )
 
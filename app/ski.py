@@ -134,6 +134,14 @@ APPLE_CSS = """
     color: #8e8e93;
     font-weight: 400;
   }
+  .stat-grid {
+    display: grid;
+    grid-template-columns: repeat(4, minmax(0, 1fr));
+    gap: 12px;
+  }
+  @media (max-width: 640px) {
+    .stat-grid { grid-template-columns: repeat(2, minmax(0, 1fr)); }
+  }
 
   /* ── Similar season cards ── */
   .season-card {
@@ -428,31 +436,17 @@ def main() -> None:
     best_s = max(seasons, key=lambda s: s["total_snowfall"])
     best_season_label = f"{best_s['season_label']}"
 
-    c1, c2, c3, c4 = st.columns(4)
-    with c1:
-        st.markdown(
-            stat_html("Season Outlook", f"{stars}", rating),
-            unsafe_allow_html=True,
-        )
-    with c2:
-        st.markdown(
-            stat_html(
-                "Current Snowpack",
-                f"{snowpack}cm",
-                f"{arrow}{abs(vs_avg)}% vs avg",
-            ),
-            unsafe_allow_html=True,
-        )
-    with c3:
-        st.markdown(
-            stat_html("Best Week to Ski", best_week_label),
-            unsafe_allow_html=True,
-        )
-    with c4:
-        st.markdown(
-            stat_html("Best Season on Record", best_season_label),
-            unsafe_allow_html=True,
-        )
+    # All four pills in one CSS-grid block — a single markdown roundtrip
+    pills = (
+        stat_html("Season Outlook", f"{stars}", rating),
+        stat_html("Current Snowpack", f"{snowpack}cm", f"{arrow}{abs(vs_avg)}% vs avg"),
+        stat_html("Best Week to Ski", best_week_label),
+        stat_html("Best Season on Record", best_season_label),
+    )
+    st.markdown(
+        '<div class="stat-grid">' + "".join(p.strip() for p in pills) + "</div>",
+        unsafe_allow_html=True,
+    )
 
     st.markdown("<br>", unsafe_allow_html=True)
 
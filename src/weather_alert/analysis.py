@@ -12,6 +12,12 @@ from __future__ import annotations
 import sys
 from collections import defaultdict
 from datetime import date
+from operator import itemgetter, mul
+
+# Numeric fields unpacked per day by yearly_summary, in column order
+_DAY_FIELDS = itemgetter(
+    "temp_max", "temp_min", "temp_mean", "precipitation", "snowfall", "snow_depth_max"
+)
 
 
 def yearly_summary(records: list[dict]) -> list[dict]:
@@ -32,9 +38,9 @@ def yearly_summary(records: list[dict]) -> list[dict]:
     current_year = date.today().year
     by_year: dict[int, list[dict]] = defaultdict(list)
     for r in records:
-        if r["date"].year == current_year:
-            continue
-        by_year[r["date"].year].append(r)
+        year = r["date"].year
+        if year != current_year:
+            by_year[year].append(r)
 
     summaries = []
     for year in sorted(by_year):
@@ -42,22 +48,27 @@ def yearly_summary(records: list[dict]) -> list[dict]:
         n = len(days)
         if n == 0:
             continue
-        hottest = max(days, key=lambda d: d["temp_max"])
-        coldest = min(days, key=lambda d: d["temp_min"])
+        # Transpose the year's dicts into one tuple per field so every
+        # aggregate below is a builtin over a flat tuple, not a Python loop.
+        tmax, tmin, tmean, precip, snow, depth = zip(*map(_DAY_FIELDS, days))
+        max_temp = max(tmax)
+        min_temp = min(tmin)
         summaries.append({
             "year":                year,
-            "avg_temp_max":        round(sum(d["temp_max"]        for d in days) / n, 2),
-            "avg_temp_min":        round(sum(d["temp_min"]        for d in days) / n, 2),
-            "avg_temp_mean":       round(sum(d["temp_mean"]       for d in days) / n, 2),
-            "total_precipitation": round(sum(d["precipitation"]   for d in days), 1),
-            "total_snowfall":      round(sum(d["snowfall"]        for d in days), 1),
-            "max_snow_depth":      round(max(d["snow_depth_max"]  for d in days), 1),
-            "snow_days":           sum(1 for d in days if d["snowfall"]      > 0),
-            "rain_days":           sum(1 for d in days if d["precipitation"] > 1.0),
-            "max_temp":            hottest["temp_max"],
-            "min_temp":            coldest["temp_min"],
-            "hottest_date":        hottest["date"],
-            "coldest_date":        coldest["date"],
+            "avg_temp_max":        round(sum(tmax)   / n, 2),
+            "avg_temp_min":        round(sum(tmin)   / n, 2),
+            "avg_temp_mean":       round(sum(tmean)  / n, 2),
+            "total_precipitation": round(sum(precip), 1),
+            "total_snowfall":      round(sum(snow),   1),
+            "max_snow_depth":      round(max(depth),  1),
+            "snow_days":           sum(1 for v in snow   if v > 0),
+            "rain_days":           sum(1 for v in precip if v > 1.0),
+            "max_temp":            max_temp,
+            "min_temp":            min_temp,
+            # index() finds the first occurrence, matching max()/min() ties;
+            # max() + index() keeps both scans in C rather than a keyed max().
+            "hottest_date":        days[tmax.index(max_temp)]["date"],
+            "coldest_date":        days[tmin.index(min_temp)]["date"],
         })
     return summaries
 
@@ -74,9 +85,9 @@ def monthly_climatology(records: list[dict]) -> list[dict]:
     current_year = date.today().year
     by_month: dict[int, list[dict]] = defaultdict(list)
     for r in records:
-        if r["date"].year == current_year:
-            continue
-        by_month[r["date"].month].append(r)
+        d = r["date"]
+        if d.year != current_year:
+            by_month[d.month].append(r)
 
     result = []
     for month in range(1, 13):
@@ -102,7 +113,8 @@ def monthly_climatology(records: list[dict]) -> list[dict]:
 def temperature_trend(yearly: list[dict]) -> dict:
     """Compute linear regression of avg_temp_mean over years (stdlib only).
 
-    OLS formula: slope = (n*sum(xy) - sum(x)*sum(y)) / (n*sum(x^2) - sum(x)^2)
+    OLS on centred data: slope = Sxy / Sxx, r^2 = Sxy^2 / (Sxx * Syy), where
+    Sxy = sum(dx*dy) etc. Each S term is one C-level sum(map(mul, ...)) pass.
 
     Returns dict with keys:
         slope (float, degrees C per year),
@@ -113,26 +125,22 @@ def temperature_trend(yearly: list[dict]) -> dict:
     if len(yearly) < 2:
         return {"slope": 0.0, "slope_per_decade": 0.0, "r_squared": 0.0, "label": "stable"}
 
-    xs = [float(y["year"])          for y in yearly]
-    ys = [float(y["avg_temp_mean"]) for y in yearly]
-    n  = len(xs)
-
-    sum_x  = sum(xs)
-    sum_y  = sum(ys)
-    sum_xy = sum(x * y for x, y in zip(xs, ys))
-    sum_x2 = sum(x * x for x in xs)
+    xs, ys = zip(*map(itemgetter("year", "avg_temp_mean"), yearly))
+    n      = len(xs)
+    x_mean = sum(xs) / n
+    y_mean = sum(ys) / n
+    dx = [x - x_mean for x in xs]
+    dy = [y - y_mean for y in ys]
 
-    denom = n * sum_x2 - sum_x ** 2
-    if denom == 0:
+    s_xx = sum(map(mul, dx, dx))
+    if s_xx == 0:
         return {"slope": 0.0, "slope_per_decade": 0.0, "r_squared": 0.0, "label": "stable"}
+    s_xy = sum(map(mul, dx, dy))
+    s_yy = sum(map(mul, dy, dy))
 
-    slope     = (n * sum_xy - sum_x * sum_y) / denom
-    intercept = (sum_y - slope * sum_x) / n
-
-    y_mean = sum_y / n
-    ss_tot = sum((y - y_mean) ** 2 for y in ys)
-    ss_res = sum((y - (slope * x + intercept)) ** 2 for x, y in zip(xs, ys))
-    r_sq   = 1.0 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
+    slope = s_xy / s_xx
+    # Equal to 1 - SS_res / SS_tot for a least-squares line
+    r_sq  = (s_xy * s_xy) / (s_xx * s_yy) if s_yy > 0 else 0.0
 
     per_decade = round(slope * 10, 2)
     if slope > 0.005:
@@ -159,13 +167,36 @@ def find_extremes(yearly: list[dict]) -> dict:
     if not yearly:
         return {}
 
-    hottest   = max(yearly, key=lambda y: y["max_temp"])
-    coldest   = min(yearly, key=lambda y: y["min_temp"])
-    wettest   = max(yearly, key=lambda y: y["total_precipitation"])
-    driest    = min(yearly, key=lambda y: y["total_precipitation"])
-    snowiest  = max(yearly, key=lambda y: y["total_snowfall"])
-    least_sn  = min(yearly, key=lambda y: y["total_snowfall"])
-    most_days = max(yearly, key=lambda y: y["snow_days"])
+    # One pass tracking all seven extremes instead of seven keyed max()/min()
+    # scans. Strict comparisons keep the earliest year on ties, as max()/min() do.
+    first = yearly[0]
+    hottest = coldest = wettest = driest = snowiest = least_sn = most_days = first
+    hot_v      = first["max_temp"]
+    cold_v     = first["min_temp"]
+    wet_v      = dry_v = first["total_precipitation"]
+    snow_v     = least_snow_v = first["total_snowfall"]
+    snow_day_v = first["snow_days"]
+
+    for y in yearly:
+        v = y["max_temp"]
+        if v > hot_v:
+            hot_v, hottest = v, y
+        v = y["min_temp"]
+        if v < cold_v:
+            cold_v, coldest = v, y
+        v = y["total_precipitation"]
+        if v > wet_v:
+            wet_v, wettest = v, y
+        if v < dry_v:
+            dry_v, driest = v, y
+        v = y["total_snowfall"]
+        if v > snow_v:
+            snow_v, snowiest = v, y
+        if v < least_snow_v:
+            least_snow_v, least_sn = v, y
+        v = y["snow_days"]
+        if v > snow_day_v:
+            snow_day_v, most_days = v, y
 
     return {
         "hottest_year":              hottest["year"],
@@ -189,6 +220,31 @@ def find_extremes(yearly: list[dict]) -> dict:
     }
 
 
+# Fixed layout for terminal_summary, filled by a single str.format call
+_SUMMARY_TEMPLATE = (
+    "📍 {location} — {n_years}-year Historical Analysis ({start_yr}–{end_yr})\n"
+    "{sep}\n"
+    "🌡  Temperature trend:   {per_decade}\n"
+    "📊  Average annual temp: {overall_mean}°C  (range: {overall_min}°C to {overall_max}°C)\n"
+    "\n"
+    "🌧  Wettest year:        {wettest_year} ({wettest_year_precip} mm)\n"
+    "☀️  Driest year:         {driest_year} ({driest_year_precip} mm)\n"
+    "\n"
+    "❄️  Snowiest year:       {snowiest_year} ({snowiest_year_snowfall} cm total, {snowiest_year_snow_days} snow days)\n"
+    "🌱  Least snow:          {least_snow_year} ({least_snow_year_snowfall} cm total, {least_snow_year_snow_days} snow days)\n"
+    "\n"
+    "🔥  Hottest recorded:    {hottest_year_max_temp}°C on {hottest_date}\n"
+    "🥶  Coldest recorded:    {coldest_year_min_temp}°C on {coldest_date}\n"
+    "{sep}"
+)
+_SUMMARY_EXTREME_KEYS = (
+    "wettest_year", "wettest_year_precip", "driest_year", "driest_year_precip",
+    "snowiest_year", "snowiest_year_snowfall", "snowiest_year_snow_days",
+    "least_snow_year", "least_snow_year_snowfall", "least_snow_year_snow_days",
+    "hottest_year_max_temp", "coldest_year_min_temp",
+)
+
+
 def terminal_summary(
     location_name: str,
     yearly: list[dict],
@@ -224,23 +280,37 @@ def terminal_summary(
         day_fmt = "%-d" if sys.platform != "win32" else "%#d"
         return d.strftime(f"{day_fmt} %b %Y")
 
-    lines = [
-        f"📍 {location_name} — {n_years}-year Historical Analysis ({start_yr}–{end_yr})",
-        sep,
-        f"🌡  Temperature trend:   {per_decade_str}",
-        f"📊  Average annual temp: {overall_mean}°C  (range: {overall_min}°C to {overall_max}°C)",
-        "",
-        f"🌧  Wettest year:        {extremes.get('wettest_year')} ({extremes.get('wettest_year_precip')} mm)",
-        f"☀️  Driest year:         {extremes.get('driest_year')} ({extremes.get('driest_year_precip')} mm)",
-        "",
-        f"❄️  Snowiest year:       {extremes.get('snowiest_year')} ({extremes.get('snowiest_year_snowfall')} cm total, {extremes.get('snowiest_year_snow_days')} snow days)",
-        f"🌱  Least snow:          {extremes.get('least_snow_year')} ({extremes.get('least_snow_year_snowfall')} cm total, {extremes.get('least_snow_year_snow_days')} snow days)",
-        "",
-        f"🔥  Hottest recorded:    {extremes.get('hottest_year_max_temp')}°C on {fmt_date(extremes.get('hottest_date'))}",
-        f"🥶  Coldest recorded:    {extremes.get('coldest_year_min_temp')}°C on {fmt_date(extremes.get('coldest_date'))}",
-        sep,
-    ]
-    return "\n".join(lines)
+    # Missing extremes render as "None", as the per-line f-strings did
+    fields = {key: extremes.get(key) for key in _SUMMARY_EXTREME_KEYS}
+    return _SUMMARY_TEMPLATE.format(
+        location=location_name,
+        n_years=n_years,
+        start_yr=start_yr,
+        end_yr=end_yr,
+        sep=sep,
+        per_decade=per_decade_str,
+        overall_mean=overall_mean,
+        overall_min=overall_min,
+        overall_max=overall_max,
+        hottest_date=fmt_date(extremes.get("hottest_date")),
+        coldest_date=fmt_date(extremes.get("coldest_date")),
+        **fields,
+    )
+
+
+class _SeasonTotals:
+    """Running totals for one (year, season) bucket in seasonal_breakdown.
+
+    __slots__ makes each field a fixed-offset attribute, which CPython's
+    specialising interpreter updates faster than string keys of a dict.
+    """
+
+    __slots__ = ("sum_temp", "sum_precip", "n")
+
+    def __init__(self) -> None:
+        self.sum_temp = 0.0
+        self.sum_precip = 0.0
+        self.n = 0
 
 
 def seasonal_breakdown(records: list[dict]) -> dict:
@@ -287,8 +357,8 @@ def seasonal_breakdown(records: list[dict]) -> dict:
     }
 
     # Accumulate totals and counts per (year, season)
-    buckets: dict[int, dict[str, dict[str, float | int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"sum_temp": 0.0, "sum_precip": 0.0, "n": 0})
+    buckets: dict[int, dict[str, _SeasonTotals]] = defaultdict(
+        lambda: defaultdict(_SeasonTotals)
     )
 
     for r in records:
@@ -302,18 +372,18 @@ def seasonal_breakdown(records: list[dict]) -> dict:
         if bucket_year == current_year:
             continue
         b = buckets[bucket_year][season]
-        b["sum_temp"]   += r["temp_mean"]
-        b["sum_precip"] += r["precipitation"]
-        b["n"]          += 1
+        b.sum_temp   += r["temp_mean"]
+        b.sum_precip += r["precipitation"]
+        b.n          += 1
 
     result: dict[int, dict[str, dict[str, float]]] = {}
     for year in sorted(buckets):
         result[year] = {}
         for season, b in buckets[year].items():
-            n = b["n"]
+            n = b.n
             result[year][season] = {
-                "avg_temp_mean":       round(b["sum_temp"] / n, 2) if n else 0.0,
-                "total_precipitation": round(b["sum_precip"], 1),
+                "avg_temp_mean":       round(b.sum_temp / n, 2) if n else 0.0,
+                "total_precipitation": round(b.sum_precip, 1),
             }
     return result
 
@@ -333,12 +403,13 @@ def yearly_humidity(records: list[dict]) -> list[dict]:
 
     by_year: dict[int, list[float]] = defaultdict(list)
     for r in records:
-        if r["date"].year == current_year:
+        year = r["date"].year
+        if year == current_year:
             continue
         h = r.get("humidity_mean")
         if h is None:
             continue
-        by_year[r["date"].year].append(float(h))
+        by_year[year].append(float(h))
 
     return [
         {"year": year, "avg_humidity": round(sum(vals) / len(vals), 2)}
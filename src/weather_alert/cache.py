@@ -0,0 +1,102 @@
+# Project: weather-alert
+# Owner: GreenUnicorn
+# Built with: Claude (Anthropic)
+"""
+cache.py — Small on-disk JSON cache for API responses.
+
+Each entry is one JSON file under ~/.cache/weather-alert/ (next to the ski
+data cache) holding the value and the time it was written. The TTL is chosen
+by the caller at read time, so the same entry can serve as a fresh hit under
+one TTL and, once expired, as the basis for an If-Modified-Since request.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path.home() / ".cache" / "weather-alert"
+KEY_DIGEST_LENGTH = 16  # hex chars of the sha1 key digest used in file names
+
+
+def cache_path(namespace: str, key: str, cache_dir: Path = CACHE_DIR) -> Path:
+    """Return the cache file path for a namespaced key.
+
+    Args:
+        namespace: Short prefix grouping related entries, e.g. 'geocode'.
+        key: Arbitrary string identifying the entry (hashed into the file name).
+        cache_dir: Directory holding the cache files.
+
+    Returns:
+        Path like ~/.cache/weather-alert/geocode_1a2b3c4d5e6f7a8b.json
+    """
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:KEY_DIGEST_LENGTH]
+    return cache_dir / f"{namespace}_{digest}.json"
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write payload as JSON so that readers never see a partial file.
+
+    The JSON goes to a uniquely named temp file in the same directory, which
+    os.replace() then renames over path in one atomic step. A concurrent
+    reader (say the dashboard while a cron run refreshes the same entry)
+    gets either the old file or the new one, and a failed write leaves the
+    old file intact.
+
+    Args:
+        path: Destination file; its parent directory is created if needed.
+        payload: JSON-serialisable value to write.
+
+    Raises:
+        OSError: If the directory or file cannot be written.
+        TypeError: If payload is not JSON-serialisable.
+        ValueError: If payload is not JSON-serialisable.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_cached(path: Path, ttl_seconds: float) -> Any | None:
+    """Read a cached value if it was written less than ttl_seconds ago.
+
+    Args:
+        path: Cache file path from cache_path().
+        ttl_seconds: Maximum entry age in seconds.
+
+    Returns:
+        The cached value, or None if the file is missing, unreadable,
+        malformed, or older than ttl_seconds.
+    """
+    try:
+        with open(path) as f:
+            payload = json.load(f)
+        if time.time() - payload["ts"] > ttl_seconds:
+            return None
+        return payload["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_cached(path: Path, value: Any) -> None:
+    """Write a JSON-serialisable value to the cache with the current timestamp.
+
+    Failures are swallowed — the cache is an optimisation, never a requirement.
+
+    Args:
+        path: Cache file path from cache_path().
+        value: JSON-serialisable value to store.
+    """
+    try:
+        write_json_atomic(path, {"ts": time.time(), "value": value})
+    except (OSError, TypeError, ValueError):
+        pass
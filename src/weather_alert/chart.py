@@ -9,6 +9,7 @@ All rendering functions return strings ready to print.
 """
 
 import os
+from operator import itemgetter
 
 from weather_alert.utils import fmt_day, fmt_hour
 
@@ -19,6 +20,21 @@ BAR_LABEL_RESERVE: int = 30  # characters reserved for label + value outside the
 _fmt_day = fmt_day
 _fmt_hour = fmt_hour
 
+# Pulls a daily forecast dict into a row tuple in table column order
+_DAILY_ROW_FIELDS = itemgetter(
+    "date", "temp_max", "temp_min", "rain_probability",
+    "snowfall_cm", "snow_depth_cm", "wind_max", "wind_direction",
+)
+
+# Row templates, indexed by row-tuple position so the snow columns can be
+# dropped without reshaping the tuple (str.format ignores unused arguments).
+_DAILY_ROW_HEAD = "{0:<10}  {1:>5.1f}°  {2:>5.1f}°  {3:>5}%"
+_DAILY_ROW_SNOW = "  {4:>7.1f} cm  {5:>8.1f} cm"
+_DAILY_ROW_WIND = "  {6:>8.0f} {7}"
+_HOURLY_ROW_HEAD = "{0:<7}  {1:>6.1f}°  {2:>7.1f}°  {3:>5}%  {4:>5}%"
+_HOURLY_ROW_SNOW = "  {5:>7.1f} cm"
+_HOURLY_ROW_WIND = "  {6:>7.0f} {7}"
+
 
 def render_daily_table(days: list[dict], location_line: str) -> str:
     """Render a multi-day forecast as a fixed-width ASCII table.
@@ -30,7 +46,10 @@ def render_daily_table(days: list[dict], location_line: str) -> str:
     Returns:
         Multi-line string containing the formatted table.
     """
-    has_snow = any(d["snowfall_cm"] > 0 or d["snow_depth_cm"] > 0 for d in days)
+    # Extract each day's fields once; the snow check and the render loop then
+    # read plain tuples instead of hashing the same dict keys twice per row.
+    rows = list(map(_DAILY_ROW_FIELDS, days))
+    has_snow = any(row[4] > 0 or row[5] > 0 for row in rows)
 
     header_label = f"📍 {location_line} — {len(days)}-day forecast"
     col_widths = {
@@ -54,23 +73,13 @@ def render_daily_table(days: list[dict], location_line: str) -> str:
 
     header_row = "  ".join(headers)
 
-    lines = [header_label, sep, header_row, sep]
-
-    for d in days:
-        row_parts = [
-            f"{_fmt_day(d['date']):<10}",
-            f"{d['temp_max']:>5.1f}°",
-            f"{d['temp_min']:>5.1f}°",
-            f"{d['rain_probability']:>5}%",
-        ]
-        if has_snow:
-            row_parts.append(f"{d['snowfall_cm']:>7.1f} cm")
-            row_parts.append(f"{d['snow_depth_cm']:>8.1f} cm")
-        row_parts.append(f"{d['wind_max']:>8.0f} {d['wind_direction']}")
-        lines.append("  ".join(row_parts))
+    # One C-level format call per row instead of six f-strings and a join
+    row_format = (
+        _DAILY_ROW_HEAD + (_DAILY_ROW_SNOW if has_snow else "") + _DAILY_ROW_WIND
+    ).format
+    body = [row_format(_fmt_day(day), *fields) for day, *fields in rows]
 
-    lines.append(sep)
-    return "\n".join(lines)
+    return "\n".join([header_label, sep, header_row, sep, *body, sep])
 
 
 def render_hourly_table(hours: list[dict], location_line: str) -> str:
@@ -94,31 +103,48 @@ def render_hourly_table(hours: list[dict], location_line: str) -> str:
     headers += [" Wind km/h"]
 
     header_row = "  ".join(headers)
-    lines = [header_label, sep, header_row, sep]
-
-    for h in hours:
-        row_parts = [
-            f"{_fmt_hour(h['time']):<7}",
-            f"{h['temperature']:>6.1f}°",
-            f"{h['feels_like']:>7.1f}°",
-            f"{h.get('precipitation_probability', 0):>5}%",
-            f"{h.get('humidity', 0):>5}%",
-        ]
-        if has_snow:
-            row_parts.append(f"{h.get('snowfall', 0):>7.1f} cm")
-        row_parts.append(
-            f"{h['wind_speed']:>7.0f} {h.get('wind_direction', '')}"
+
+    row_format = (
+        _HOURLY_ROW_HEAD + (_HOURLY_ROW_SNOW if has_snow else "") + _HOURLY_ROW_WIND
+    ).format
+    body = [
+        row_format(
+            _fmt_hour(h["time"]),
+            h["temperature"],
+            h["feels_like"],
+            h.get("precipitation_probability", 0),
+            h.get("humidity", 0),
+            h.get("snowfall", 0),
+            h["wind_speed"],
+            h.get("wind_direction", ""),
         )
-        lines.append("  ".join(row_parts))
+        for h in hours
+    ]
 
-    lines.append(sep)
-    return "\n".join(lines)
+    return "\n".join([header_label, sep, header_row, sep, *body, sep])
 
 
 # ─────────────────────────────────────────────────────────────
 # Bar chart helpers
 # ─────────────────────────────────────────────────────────────
 
+def _default_bar_width() -> int:
+    """Return a bar width that fits the current terminal.
+
+    Queries the terminal size (an ioctl on the controlling tty), so callers
+    rendering several charts should call this once and pass the result down.
+
+    Returns:
+        Bar width in characters, never less than 10.
+    """
+    try:
+        terminal_width = os.get_terminal_size().columns
+    except OSError:
+        terminal_width = FALLBACK_TERMINAL_WIDTH
+    # Reserve space for: label(10) + " │" + bar + "│ " + value(8)
+    return max(10, terminal_width - BAR_LABEL_RESERVE)
+
+
 def _bar(value: float, max_value: float, bar_width: int) -> str:
     """Render a single filled/empty bar scaled to bar_width.
 
@@ -158,25 +184,18 @@ def render_bar_chart(
         Multi-line string containing the chart.
     """
     if bar_width is None:
-        try:
-            terminal_width = os.get_terminal_size().columns
-        except OSError:
-            terminal_width = FALLBACK_TERMINAL_WIDTH
-        # Reserve space for: label(10) + " │" + bar + "│ " + value(8)
-        bar_width = max(10, terminal_width - BAR_LABEL_RESERVE)
+        bar_width = _default_bar_width()
 
     max_val = max(values) if values else 1
     if max_val == 0:
         max_val = 1  # avoid division by zero
 
     label_w = max(len(lbl) for lbl in labels) if labels else 3
-    lines = [title]
-    for label, value in zip(labels, values):
-        bar = _bar(value, max_val, bar_width)
-        val_str = f"{value:.0f}{unit}"
-        lines.append(f"  {label:<{label_w}} │{bar}│ {val_str:>6}")
-
-    return "\n".join(lines)
+    rows = [
+        f"  {label:<{label_w}} │{_bar(value, max_val, bar_width)}│ {f'{value:.0f}{unit}':>6}"
+        for label, value in zip(labels, values)
+    ]
+    return "\n".join([title, *rows])
 
 
 def render_daily_charts(days: list[dict]) -> str:
@@ -197,28 +216,24 @@ def render_daily_charts(days: list[dict]) -> str:
     temp_shifted = [v + temp_offset for v in temp_values]
 
     # Build custom bar chart with real temp labels (not shifted values)
-    try:
-        terminal_width = os.get_terminal_size().columns
-    except OSError:
-        terminal_width = FALLBACK_TERMINAL_WIDTH
-    bar_width = max(10, terminal_width - BAR_LABEL_RESERVE)
+    # Sized once here and shared with the snow chart below
+    bar_width = _default_bar_width()
     label_w = max(len(l) for l in labels)
     max_shifted = max(temp_shifted) if temp_shifted else 1
     if max_shifted == 0:
         max_shifted = 1
 
-    parts = ["Temperature (max°C)"]
-    for label, shifted, real in zip(labels, temp_shifted, temp_values):
-        bar = _bar(shifted, max_shifted, bar_width)
-        parts.append(f"  {label:<{label_w}} │{bar}│ {real:>4.0f}°C")
-
-    charts = "\n".join(parts)
+    rows = [
+        f"  {label:<{label_w}} │{_bar(shifted, max_shifted, bar_width)}│ {real:>4.0f}°C"
+        for label, shifted, real in zip(labels, temp_shifted, temp_values)
+    ]
+    charts = "\n".join(["Temperature (max°C)", *rows])
 
     has_snow = any(d["snow_depth_cm"] > 0 for d in days)
     if has_snow:
         snow_values = [d["snow_depth_cm"] for d in days]
         charts += "\n\n" + render_bar_chart(
-            labels, snow_values, "Snow depth (cm)", unit=" cm"
+            labels, snow_values, "Snow depth (cm)", unit=" cm", bar_width=bar_width
         )
 
     return charts
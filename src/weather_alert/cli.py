@@ -17,19 +17,92 @@ Commands:
 """
 
 import argparse
+import re
 import subprocess
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from weather_alert import __version__
-from weather_alert.config import load_config
-from weather_alert.weather import fetch_forecast, fetch_daily_forecast
-from weather_alert.rules import evaluate_rules, evaluate_daily_rules
-from weather_alert.notify import send_test_notification, send_weather_notification
-from weather_alert.chart import render_daily_table, render_hourly_table
 from weather_alert.utils import write_last_run, read_last_run, fmt_day as _fmt_day
 
+# Command-specific modules are imported inside each cmd_* function, so a
+# command only pays for the modules it uses (cron runs this every hour).
+
+# Accepted --time formats, tried in order; the flag marks formats carrying a date
+TIME_FORMATS: tuple[tuple[str, bool], ...] = (
+    ("%H:%M", False),
+    ("%Y-%m-%d %H:%M", True),
+)
+
+
+def _parse_target_time(raw: str) -> str | None:
+    """Convert a --time value into the forecast's hourly lookup key.
+
+    Args:
+        raw: User input such as '15:00' (today) or '2026-02-25 09:00'.
+
+    Returns:
+        Hour string like '2026-02-25T09:00', or None if raw matches none of
+        TIME_FORMATS. Minutes are truncated to the hour the forecast covers.
+    """
+    for fmt, has_date in TIME_FORMATS:
+        try:
+            dt = datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+        if not has_date:
+            today = datetime.now()
+            dt = dt.replace(year=today.year, month=today.month, day=today.day)
+        return dt.strftime("%Y-%m-%dT%H:00")
+    return None
+
+
+# Active (uncommented) crontab lines running a given weather-alert subcommand.
+# Matching the subcommand keeps the hourly and ski jobs from shadowing each other.
+RUN_ONCE_JOB = re.compile(r"^[ \t]*[^#\s].*\bweather-alert run-once\b", re.MULTILINE)
+SKI_CHECK_JOB = re.compile(r"^[ \t]*[^#\s].*\bweather-alert ski-check\b", re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def _weather_alert_binary() -> str | None:
+    """Return the absolute path of the installed weather-alert script, if any.
+
+    shutil.which() stats every $PATH entry, so the result is looked up once
+    per process and shared by the schedule commands.
+    """
+    import shutil
+
+    return shutil.which("weather-alert")
+
+
+def _read_crontab() -> str | None:
+    """Return the current user's crontab, or None if they have none.
+
+    Only stdout is piped: `crontab -l` writes nothing but "no crontab for
+    <user>" to stderr, so it goes to /dev/null instead of a second pipe.
+    """
+    result = subprocess.run(
+        ["crontab", "-l"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+def _write_crontab(content: str) -> subprocess.CompletedProcess:
+    """Replace the current user's crontab with content via `crontab -`.
+
+    Only stderr is piped, for the caller's error message; crontab prints
+    nothing useful on stdout.
+    """
+    return subprocess.run(
+        ["crontab", "-"],
+        input=content,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
 
 def _print_single_hour_report(
     current: dict,
@@ -51,28 +124,41 @@ def _print_single_hour_report(
         lookahead: Number of lookahead hours shown for rain.
         alerts: List of triggered alert strings.
     """
-    print(f"\n📍 {display_name} — {time_str} ({time_label})")
-    print(f"🌡  Temperature:    {current['temperature']}°C  (feels like {current['feels_like']}°C)")
-    print(f"💧 Humidity:        {current.get('humidity', 'N/A')}%")
-    print(f"🌧  Rain chance:    {max_rain}%  (next {lookahead} hours)")
-    print(f"💨 Wind:            {current['wind_speed']} km/h {current.get('wind_direction', '')}")
+    lines = [
+        "",
+        f"📍 {display_name} — {time_str} ({time_label})",
+        f"🌡  Temperature:    {current['temperature']}°C  (feels like {current['feels_like']}°C)",
+        f"💧 Humidity:        {current.get('humidity', 'N/A')}%",
+        f"🌧  Rain chance:    {max_rain}%  (next {lookahead} hours)",
+        f"💨 Wind:            {current['wind_speed']} km/h {current.get('wind_direction', '')}",
+    ]
     snowfall = current.get("snowfall", 0) or 0
     snow_depth = current.get("snow_depth", 0) or 0
     if snowfall > 0:
-        print(f"❄️  Snowfall:        {snowfall} cm")
+        lines.append(f"❄️  Snowfall:        {snowfall} cm")
     if snow_depth > 0:
-        print(f"🏔️  Snow depth:      {snow_depth} cm on ground")
+        lines.append(f"🏔️  Snow depth:      {snow_depth} cm on ground")
     if alerts:
-        print()
-        for alert in alerts:
-            print(f"⚠️  ALERT: {alert}")
+        lines.append("")
+        lines.extend(f"⚠️  ALERT: {alert}" for alert in alerts)
     else:
-        print("✅ No alerts triggered.")
+        lines.append("✅ No alerts triggered.")
+    # One write for the whole report instead of one print() per line
+    print("\n".join(lines))
 
 
 def cmd_run_once(args) -> None:
     """Fetch weather, print report, evaluate rules, send notifications."""
-    from weather_alert.geocode import geocode
+    from weather_alert.chart import render_daily_table, render_hourly_table
+    from weather_alert.config import load_config
+    from weather_alert.geocode import GEOCODE_CACHE_TTL_SECONDS, geocode
+    from weather_alert.notify import send_weather_notification
+    from weather_alert.rules import evaluate_daily_rules, evaluate_rules
+    from weather_alert.weather import (
+        FORECAST_CACHE_TTL_SECONDS,
+        fetch_daily_forecast,
+        fetch_forecast,
+    )
 
     try:
         config = load_config()
@@ -85,7 +171,7 @@ def cmd_run_once(args) -> None:
         if args.location:
             from weather_alert.geocode import LocationNotFoundError
             try:
-                loc = geocode(args.location)
+                loc = geocode(args.location, cache_ttl=GEOCODE_CACHE_TTL_SECONDS)
             except LocationNotFoundError as e:
                 print(f"[error] {e}")
                 raise SystemExit(1)
@@ -104,16 +190,10 @@ def cmd_run_once(args) -> None:
         if args.time:
             time_label = "forecast"
             raw = args.time.strip()
-            if len(raw) == 5 and ":" in raw:
-                today = datetime.now().strftime("%Y-%m-%d")
-                target_time_str = f"{today}T{raw}"
-            else:
-                try:
-                    dt = datetime.strptime(raw, "%Y-%m-%d %H:%M")
-                    target_time_str = dt.strftime("%Y-%m-%dT%H:00")
-                except ValueError:
-                    print(f"[error] Unrecognised --time format: '{raw}'. Use 'HH:MM' or 'YYYY-MM-DD HH:MM'.")
-                    raise SystemExit(1)
+            target_time_str = _parse_target_time(raw)
+            if target_time_str is None:
+                print(f"[error] Unrecognised --time format: '{raw}'. Use 'HH:MM' or 'YYYY-MM-DD HH:MM'.")
+                raise SystemExit(1)
 
         window = getattr(args, "forecast_window", 1)
 
@@ -121,22 +201,23 @@ def cmd_run_once(args) -> None:
         if window >= 2:
             days = min(window, 16)
             print(f"Fetching {days}-day forecast for {display_name}...")
-            daily = fetch_daily_forecast(latitude=latitude, longitude=longitude, forecast_days=days)
-
-            print()
-            print(render_daily_table(daily, display_name))
-            print()
-
-            # Evaluate alerts per day
-            any_alerts = False
-            for day in daily:
-                day_alerts = evaluate_daily_rules(day, config)
-                for alert in day_alerts:
-                    print(f"⚠️  {_fmt_day(day['date'])}: {alert}")
-                    any_alerts = True
+            daily = fetch_daily_forecast(
+                latitude=latitude,
+                longitude=longitude,
+                forecast_days=days,
+                cache_ttl=FORECAST_CACHE_TTL_SECONDS,
+            )
 
+            # Evaluate alerts per day; the table and alerts go out in one write
+            alert_lines = [
+                f"⚠️  {_fmt_day(day['date'])}: {alert}"
+                for day in daily
+                for alert in evaluate_daily_rules(day, config)
+            ]
+            any_alerts = bool(alert_lines)
             if not any_alerts:
-                print("✅ No alerts in forecast window.")
+                alert_lines.append("✅ No alerts in forecast window.")
+            print("\n".join(["", render_daily_table(daily, display_name), "", *alert_lines]))
             write_last_run("OK", "Alerts in window" if any_alerts else "No alerts in window")
             return
 
@@ -152,6 +233,8 @@ def cmd_run_once(args) -> None:
                 longitude=longitude,
                 forecast_hours=fetch_hours,
                 target_time_str=target_time_str,
+                # Cron fires hourly; manual runs in between reuse its response
+                cache_ttl=FORECAST_CACHE_TTL_SECONDS,
             )
         except RuntimeError as e:
             print(str(e))
@@ -164,17 +247,10 @@ def cmd_run_once(args) -> None:
         # If window > 1, show the multi-hour table instead of a single-line report
         if window > 1:
             display_hours = forecast[:window]
-            print()
-            print(render_hourly_table(display_hours, display_name))
-
-            print()
             # Evaluate rules over the window
-            alerts = evaluate_rules(forecast[:window], config)
-            if alerts:
-                for alert in alerts:
-                    print(f"⚠️  ALERT: {alert}")
-            else:
-                print("✅ No alerts triggered.")
+            alerts = evaluate_rules(display_hours, config)
+            alert_lines = [f"⚠️  ALERT: {alert}" for alert in alerts] or ["✅ No alerts triggered."]
+            print("\n".join(["", render_hourly_table(display_hours, display_name), "", *alert_lines]))
             write_last_run("OK", f"{len(alerts)} alert(s) triggered" if alerts else "No alerts")
             return
 
@@ -182,7 +258,8 @@ def cmd_run_once(args) -> None:
         current = forecast[0]
 
         try:
-            dt = datetime.strptime(current["time"], "%Y-%m-%dT%H:%M")
+            # fromisoformat is C-implemented; strptime goes through _strptime's regexes
+            dt = datetime.fromisoformat(current["time"])
             time_str = dt.strftime("%a %d %b, %H:%M")
         except ValueError:
             time_str = current["time"]
@@ -221,6 +298,9 @@ def cmd_run_once(args) -> None:
 
 def cmd_test_notification(args) -> None:
     """Send a fake alert to verify macOS notifications work."""
+    from weather_alert.config import load_config
+    from weather_alert.notify import send_test_notification
+
     try:
         config = load_config()
     except FileNotFoundError:
@@ -231,11 +311,10 @@ def cmd_test_notification(args) -> None:
 
 def cmd_install_schedule(args) -> None:
     """Install an hourly cron job to run weather-alert run-once."""
-    import shutil
-    import subprocess
+    from weather_alert.config import load_config
 
     # Resolve the weather-alert binary path
-    binary = shutil.which("weather-alert")
+    binary = _weather_alert_binary()
     if not binary:
         print("[error] Could not find weather-alert binary. Make sure it is installed with pip install -e .")
         raise SystemExit(1)
@@ -255,16 +334,10 @@ def cmd_install_schedule(args) -> None:
     cron_line = f"0 * * * * {binary} run-once >> {cron_log} 2>&1"
 
     # Read the existing crontab (empty string if none exists yet)
-    result = subprocess.run(
-        ["crontab", "-l"],
-        capture_output=True,
-        text=True,
-    )
-    # crontab -l exits non-zero when no crontab exists — treat that as empty
-    existing = result.stdout if result.returncode == 0 else ""
+    existing = _read_crontab() or ""
 
     # Guard against double-installation
-    if "weather-alert" in existing:
+    if RUN_ONCE_JOB.search(existing):
         print("[schedule] Already installed. Run uninstall-schedule first.")
         raise SystemExit(0)
 
@@ -275,12 +348,7 @@ def cmd_install_schedule(args) -> None:
     updated += cron_line + "\n"
 
     # Write back via crontab -
-    write_result = subprocess.run(
-        ["crontab", "-"],
-        input=updated,
-        capture_output=True,
-        text=True,
-    )
+    write_result = _write_crontab(updated)
     if write_result.returncode != 0:
         print(f"[error] Failed to write crontab: {write_result.stderr.strip()}")
         raise SystemExit(1)
@@ -291,34 +359,22 @@ def cmd_install_schedule(args) -> None:
 
 def cmd_uninstall_schedule(args) -> None:
     """Remove the weather-alert cron job."""
-    import subprocess
-
-    # Read current crontab
-    result = subprocess.run(
-        ["crontab", "-l"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
+    existing = _read_crontab()
+    if existing is None:
         # No crontab at all — nothing to remove
         print("[schedule] No crontab found. Nothing to remove.")
         return
 
-    lines = result.stdout.splitlines(keepends=True)
-    filtered = [line for line in lines if "weather-alert" not in line]
-
-    if len(filtered) == len(lines):
+    # One scan of the whole crontab before splitting it into lines
+    if not RUN_ONCE_JOB.search(existing):
         print("[schedule] No weather-alert cron job found. Nothing to remove.")
         return
+    filtered = [
+        line for line in existing.splitlines(keepends=True) if not RUN_ONCE_JOB.match(line)
+    ]
 
     # Write filtered lines back (or clear the crontab if now empty)
-    updated = "".join(filtered)
-    write_result = subprocess.run(
-        ["crontab", "-"],
-        input=updated,
-        capture_output=True,
-        text=True,
-    )
+    write_result = _write_crontab("".join(filtered))
     if write_result.returncode != 0:
         print(f"[error] Failed to write crontab: {write_result.stderr.strip()}")
         raise SystemExit(1)
@@ -328,7 +384,7 @@ def cmd_uninstall_schedule(args) -> None:
 
 def cmd_status(args) -> None:
     """Show cron job status, last run info, and log file size."""
-    import subprocess
+    from weather_alert.config import load_config
 
     try:
         config = load_config()
@@ -339,8 +395,8 @@ def cmd_status(args) -> None:
     log_dir = log_path.parent
 
     # Check cron
-    result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
-    cron_installed = result.returncode == 0 and "weather-alert" in result.stdout
+    crontab = _read_crontab()
+    cron_installed = crontab is not None and RUN_ONCE_JOB.search(crontab) is not None
     cron_status = "✅ Installed" if cron_installed else "❌ Not installed"
 
     # Read last run
@@ -379,7 +435,11 @@ def cmd_ski(args: argparse.Namespace) -> None:
     """Fetch ski season data, print forecast, and launch Streamlit dashboard."""
     from pathlib import Path
 
-    from weather_alert.geocode import LocationNotFoundError, geocode
+    from weather_alert.geocode import (
+        GEOCODE_CACHE_TTL_SECONDS,
+        LocationNotFoundError,
+        geocode,
+    )
     from weather_alert.ski import (
         best_weeks_to_ski,
         fetch_ski_data,
@@ -394,7 +454,7 @@ def cmd_ski(args: argparse.Namespace) -> None:
 
     print(f"[ski] Geocoding '{location}'…")
     try:
-        loc = geocode(location)
+        loc = geocode(location, cache_ttl=GEOCODE_CACHE_TTL_SECONDS)
     except LocationNotFoundError:
         print(f"[ski] Location not found: {location}", file=sys.stderr)
         sys.exit(1)
@@ -448,7 +508,11 @@ def cmd_ski_check(args: argparse.Namespace) -> None:
     """Fetch ski season data and send a macOS notification (designed for cron)."""
     import os
 
-    from weather_alert.geocode import LocationNotFoundError, geocode
+    from weather_alert.geocode import (
+        GEOCODE_CACHE_TTL_SECONDS,
+        LocationNotFoundError,
+        geocode,
+    )
     from weather_alert.ski import (
         fetch_ski_data,
         get_current_season_data,
@@ -460,7 +524,7 @@ def cmd_ski_check(args: argparse.Namespace) -> None:
     location = args.location
 
     try:
-        loc = geocode(location)
+        loc = geocode(location, cache_ttl=GEOCODE_CACHE_TTL_SECONDS)
     except (LocationNotFoundError, RuntimeError) as e:
         print(f"[ski-check] Geocode error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -515,9 +579,7 @@ def cmd_ski_check(args: argparse.Namespace) -> None:
 
 def cmd_ski_schedule(args: argparse.Namespace) -> None:
     """Install an annual cron job: runs ski-check on Nov 1 at 8am."""
-    import shutil
-
-    binary = shutil.which("weather-alert")
+    binary = _weather_alert_binary()
     if not binary:
         print(
             "[ski-schedule] Could not find weather-alert binary. "
@@ -529,10 +591,9 @@ def cmd_ski_schedule(args: argparse.Namespace) -> None:
     location = args.location
     cron_line = f"0 8 1 11 * {binary} ski-check --location '{location}'"
 
-    result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
-    existing = result.stdout if result.returncode == 0 else ""
+    existing = _read_crontab() or ""
 
-    if "weather-alert ski-check" in existing:
+    if SKI_CHECK_JOB.search(existing):
         print("[ski-schedule] Ski cron job already installed. Run ski-unschedule first.")
         sys.exit(0)
 
@@ -541,9 +602,7 @@ def cmd_ski_schedule(args: argparse.Namespace) -> None:
         updated += "\n"
     updated += cron_line + "\n"
 
-    write_result = subprocess.run(
-        ["crontab", "-"], input=updated, capture_output=True, text=True
-    )
+    write_result = _write_crontab(updated)
     if write_result.returncode != 0:
         print(f"[ski-schedule] Failed to write crontab: {write_result.stderr.strip()}", file=sys.stderr)
         sys.exit(1)
@@ -555,22 +614,19 @@ def cmd_ski_schedule(args: argparse.Namespace) -> None:
 
 def cmd_ski_unschedule(args: argparse.Namespace) -> None:
     """Remove the ski-check cron job."""
-    result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
-    if result.returncode != 0:
+    existing = _read_crontab()
+    if existing is None:
         print("[ski-unschedule] No crontab found. Nothing to remove.")
         return
 
-    lines = result.stdout.splitlines(keepends=True)
-    filtered = [line for line in lines if "weather-alert ski-check" not in line]
-
-    if len(filtered) == len(lines):
+    if not SKI_CHECK_JOB.search(existing):
         print("[ski-unschedule] No ski-check cron job found. Nothing to remove.")
         return
+    filtered = [
+        line for line in existing.splitlines(keepends=True) if not SKI_CHECK_JOB.match(line)
+    ]
 
-    updated = "".join(filtered)
-    write_result = subprocess.run(
-        ["crontab", "-"], input=updated, capture_output=True, text=True
-    )
+    write_result = _write_crontab("".join(filtered))
     if write_result.returncode != 0:
         print(f"[ski-unschedule] Failed to write crontab: {write_result.stderr.strip()}", file=sys.stderr)
         sys.exit(1)
@@ -581,7 +637,7 @@ def cmd_ski_unschedule(args: argparse.Namespace) -> None:
 def cmd_history(args: argparse.Namespace) -> None:
     """Fetch historical weather data and display analysis for a location."""
     from pathlib import Path
-    from weather_alert.geocode import geocode, LocationNotFoundError
+    from weather_alert.geocode import geocode, GEOCODE_CACHE_TTL_SECONDS, LocationNotFoundError
     from weather_alert.history import fetch_historical
     from weather_alert.analysis import (
         yearly_summary,
@@ -595,7 +651,7 @@ def cmd_history(args: argparse.Namespace) -> None:
 
     print(f"[weather] Geocoding '{location}'…")
     try:
-        loc = geocode(location)
+        loc = geocode(location, cache_ttl=GEOCODE_CACHE_TTL_SECONDS)
     except LocationNotFoundError:
         print(f"[weather] Location not found: {location}", file=sys.stderr)
         sys.exit(1)
@@ -633,7 +689,17 @@ def cmd_history(args: argparse.Namespace) -> None:
         print(f"[weather] Dashboard not found at {history_app}", file=sys.stderr)
 
 
-def main() -> None:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the weather-alert argument parser with all subcommands.
+
+    Cached so repeated in-process calls to main() (tests, a REPL) reuse one
+    parser instead of rewiring ten subparsers each time. It is built on
+    first use rather than at import, so importing cli stays cheap.
+
+    Returns:
+        The top-level ArgumentParser.
+    """
     parser = argparse.ArgumentParser(
         prog="weather-alert",
         description="macOS weather alert tool using Open-Meteo",
@@ -729,7 +795,17 @@ def main() -> None:
         help="Remove the ski season cron job",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse the command line and dispatch to the matching cmd_* handler.
+
+    Args:
+        argv: Arguments to parse, excluding the program name. Defaults to
+            sys.argv[1:].
+    """
+    args = _build_parser().parse_args(argv)
 
     commands = {
         "run-once": cmd_run_once,
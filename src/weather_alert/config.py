@@ -15,6 +15,9 @@ from pathlib import Path
 
 DEFAULT_CONFIG_PATH = Path("config.toml")
 
+# Resolved config path -> (st_mtime_ns when parsed, validated config)
+_CONFIG_CACHE: dict[Path, tuple[int, dict]] = {}
+
 
 def load_config(path: Path = DEFAULT_CONFIG_PATH) -> dict:
     """Load and validate a TOML configuration file.
@@ -23,18 +26,45 @@ def load_config(path: Path = DEFAULT_CONFIG_PATH) -> dict:
         path: Path to the TOML config file.
 
     Returns:
-        Nested dict of configuration values.
+        Nested dict of configuration values. The parsed, validated dict is
+        cached per resolved path and reused for as long as the file's
+        modification time is unchanged, so repeated calls cost one stat()
+        and edits are still picked up; treat it as read-only.
 
     Raises:
         FileNotFoundError: If the config file does not exist.
         ValueError: If required keys or sections are missing.
     """
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Config file not found: {path}\n"
             "Copy config.toml.example to config.toml and fill in your location."
-        )
+        ) from None
+
+    key = path.resolve()
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    config = _parse_config(key)
+    _CONFIG_CACHE[key] = (mtime_ns, config)
+    return config
+
 
+def _parse_config(path: Path) -> dict:
+    """Parse and validate a TOML config file.
+
+    Args:
+        path: Absolute path to an existing TOML config file.
+
+    Returns:
+        Nested dict of configuration values.
+
+    Raises:
+        ValueError: If required keys or sections are missing.
+    """
     with open(path, "rb") as f:
         config = tomllib.load(f)
 
@@ -8,21 +8,26 @@ Free, no API key required.
 API docs: https://open-meteo.com/en/docs/geocoding-api
 """
 
-import requests
-from weather_alert.utils import with_retry
+from weather_alert.cache import cache_path, load_cached, save_cached
+from weather_alert.utils import http_session, with_retry
 
 GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # coordinates of named places effectively never change
 
 
 class LocationNotFoundError(ValueError):
     """Raised when the geocoding API returns no results for a place name."""
 
 
-def geocode(place: str) -> dict:
+def geocode(place: str, cache_ttl: float | None = None) -> dict:
     """Look up coordinates for a place name using Open-Meteo Geocoding.
 
     Args:
         place: Human-readable place name, e.g. 'Tokyo' or 'London, UK'.
+        cache_ttl: If set, serve the result from the on-disk cache when an
+            entry for the same place (compared case- and whitespace-
+            insensitively) is younger than this many seconds, and store
+            fresh lookups there. Failed lookups are never cached.
 
     Returns:
         Dict with keys: latitude (float), longitude (float), name (str).
@@ -32,6 +37,15 @@ def geocode(place: str) -> dict:
         LocationNotFoundError: If no results are found for the place name.
         RuntimeError: If all API retry attempts fail.
     """
+    if cache_ttl is not None:
+        path = cache_path("geocode", place.strip().lower())
+        cached = load_cached(path, cache_ttl)
+        if cached is not None:
+            return cached
+        result = geocode(place)
+        save_cached(path, result)
+        return result
+
     params = {
         "name": place,
         "count": 1,
@@ -40,7 +54,7 @@ def geocode(place: str) -> dict:
     }
 
     def _call():
-        r = requests.get(GEOCODING_URL, params=params, timeout=10)
+        r = http_session().get(GEOCODING_URL, params=params, timeout=10)
         r.raise_for_status()
         return r.json()
 
@@ -6,9 +6,8 @@ history.py — Fetch historical daily weather data from Open-Meteo Archive API.
 API docs: https://open-meteo.com/en/docs/historical-weather-api
 """
 
-import requests
 from datetime import date, timedelta
-from weather_alert.utils import MAX_ATTEMPTS, RETRY_DELAY_SECONDS
+from weather_alert.utils import MAX_ATTEMPTS, RETRY_DELAY_SECONDS, http_session
 import time
 
 ARCHIVE_API_URL = "https://archive-api.open-meteo.com/v1/archive"
@@ -67,7 +66,7 @@ def fetch_historical(
     last_error: Exception | None = None
     for attempt in range(1, MAX_ATTEMPTS + 1):
         try:
-            r = requests.get(ARCHIVE_API_URL, params=params, timeout=60)
+            r = http_session().get(ARCHIVE_API_URL, params=params, timeout=60)
             # 429 = rate-limited: wait 65 s then retry (Open-Meteo resets per minute)
             if r.status_code == 429:
                 wait = 65
@@ -12,6 +12,15 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+# Title and message are read from environment variables inside AppleScript,
+# so this fixed template never needs escaping and no untrusted text ever
+# reaches the script source.
+_NOTIFY_STATEMENT = (
+    'display notification (system attribute "{message_var}") '
+    'with title (system attribute "WA_TITLE")'
+)
+_NOTIFY_SCRIPT = _NOTIFY_STATEMENT.format(message_var="WA_MSG")
+
 
 def send_notifications(alerts: list[str], config: dict) -> None:
     """Send triggered alerts via all configured notification channels.
@@ -22,11 +31,11 @@ def send_notifications(alerts: list[str], config: dict) -> None:
     """
     notif_config = config["notifications"]
 
-    for alert in alerts:
-        if notif_config.get("macos", False):
-            _send_macos_notification("Weather Alert", alert)
-        if notif_config.get("log", False):
-            _log_alert(alert, config)
+    if alerts and notif_config.get("macos", False):
+        # One osascript process for the whole batch, not one per alert
+        _send_macos_notifications("Weather Alert", alerts)
+    if alerts and notif_config.get("log", False):
+        _log_alerts(alerts, config)
 
 
 def send_test_notification(config: dict) -> None:
@@ -56,12 +65,41 @@ def _send_macos_notification(title: str, message: str) -> None:
     """
     import os
 
-    script = (
-        'display notification (system attribute "WA_MSG") '
-        'with title (system attribute "WA_TITLE")'
-    )
     env = {**os.environ, "WA_TITLE": title, "WA_MSG": message}
+    _run_osascript(_NOTIFY_SCRIPT, env, "[notify] macOS notification sent.")
+
+
+def _send_macos_notifications(title: str, messages: list[str]) -> None:
+    """Display several macOS notifications with a single osascript process.
+
+    Each osascript launch costs a fork/exec plus an AppleScript compile, so
+    the batch is sent as one script with a display statement per message.
+    As in _send_macos_notification, the strings travel in environment
+    variables (WA_TITLE, WA_MSG_0, WA_MSG_1, ...) and never appear in the
+    script source.
+
+    Args:
+        title: Notification title shared by every message.
+        messages: Notification body strings, displayed in order.
+    """
+    import os
+
+    script = "\n".join(
+        _NOTIFY_STATEMENT.format(message_var=f"WA_MSG_{i}") for i in range(len(messages))
+    )
+    env = {**os.environ, "WA_TITLE": title}
+    env.update((f"WA_MSG_{i}", message) for i, message in enumerate(messages))
+    _run_osascript(script, env, f"[notify] {len(messages)} macOS notification(s) sent.")
 
+
+def _run_osascript(script: str, env: dict, success_message: str) -> None:
+    """Run an AppleScript via osascript and report the outcome.
+
+    Args:
+        script: AppleScript source passed with -e.
+        env: Environment for the osascript process.
+        success_message: Line printed when osascript exits cleanly.
+    """
     result = subprocess.run(
         ["osascript", "-e", script],
         capture_output=True,
@@ -72,7 +110,7 @@ def _send_macos_notification(title: str, message: str) -> None:
         err = result.stderr.strip() or result.stdout.strip()
         print(f"[notify] osascript failed: {err}")
     else:
-        print("[notify] macOS notification sent.")
+        print(success_message)
 
 
 def send_weather_notification(
@@ -137,14 +175,27 @@ def _log_alert(message: str, config: dict) -> None:
         message: Text to log.
         config: Loaded configuration dict with 'log.path' key.
     """
+    _log_alerts([message], config)
+
+
+def _log_alerts(messages: list[str], config: dict) -> None:
+    """Append timestamped alert lines to the log file in a single write.
+
+    The directory check, open and close happen once per batch rather than
+    once per alert, and the lines share one timestamp.
+
+    Args:
+        messages: Texts to log, one line each.
+        config: Loaded configuration dict with 'log.path' key.
+    """
     log_path = Path(config["log"]["path"])
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_line = f"[{timestamp}] {message}\n"
+    log_lines = "".join(f"[{timestamp}] {message}\n" for message in messages)
 
     try:
         with open(log_path, "a") as f:
-            f.write(log_line)
+            f.write(log_lines)
     except OSError as e:
         print(f"[notify] Failed to write log: {e}")
@@ -155,21 +155,23 @@ def evaluate_daily_rules(day: dict, config: dict) -> list[str]:
         List of triggered alert message strings. Empty if no alerts.
     """
     alerts_config = config["alerts"]
+    # Each threshold is read once and shared by its comparison and message
+    rain_threshold = alerts_config["rain_probability_threshold"]
+    wind_threshold = alerts_config["wind_speed_threshold"]
+    min_temp = alerts_config["temperature_min"]
+    rain, wind, temp = day["rain_probability"], day["wind_max"], day["temp_min"]
     day_alerts: list[str] = []
 
-    if day["rain_probability"] >= alerts_config["rain_probability_threshold"]:
+    if rain >= rain_threshold:
         day_alerts.append(
-            f"Rain probability {day['rain_probability']}% exceeds threshold of "
-            f"{alerts_config['rain_probability_threshold']}%"
+            f"Rain probability {rain}% exceeds threshold of {rain_threshold}%"
         )
-    if day["wind_max"] >= alerts_config["wind_speed_threshold"]:
+    if wind >= wind_threshold:
         day_alerts.append(
-            f"Wind {day['wind_max']:.0f} km/h exceeds threshold of "
-            f"{alerts_config['wind_speed_threshold']} km/h"
+            f"Wind {wind:.0f} km/h exceeds threshold of {wind_threshold} km/h"
         )
-    if day["temp_min"] < alerts_config["temperature_min"]:
+    if temp < min_temp:
         day_alerts.append(
-            f"Min temperature {day['temp_min']}°C below threshold of "
-            f"{alerts_config['temperature_min']}°C"
+            f"Min temperature {temp}°C below threshold of {min_temp}°C"
         )
     return day_alerts
@@ -18,6 +18,7 @@ from collections import defaultdict
 from datetime import date, timedelta
 from pathlib import Path
 
+from weather_alert.cache import write_json_atomic
 from weather_alert.history import fetch_historical
 
 # ── Disk cache ────────────────────────────────────────────────────────────────
@@ -33,12 +34,10 @@ def _cache_path(latitude: float, longitude: float, years: int) -> Path:
 
 
 def _save_cache(path: Path, records: list[dict]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     serialisable = [
         {**r, "date": r["date"].isoformat()} for r in records
     ]
-    with open(path, "w") as f:
-        json.dump({"ts": time.time(), "records": serialisable}, f)
+    write_json_atomic(path, {"ts": time.time(), "records": serialisable})
 
 
 def _load_cache(path: Path) -> list[dict] | None:
@@ -2,17 +2,27 @@
 # Owner: GreenUnicorn
 # Built with: Claude (Anthropic)
 """
-utils.py — Shared utilities: retry logic and failure logging.
+utils.py — Shared utilities: HTTP session, retry logic and failure logging.
 """
 
 import time
 from collections import deque
 from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    import requests
 
+# Distinct date/time strings cached by fmt_day/fmt_hour. These are pure
+# functions over a small set of ISO strings, and parsing them is the
+# slowest step in rendering a forecast table.
+LABEL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=LABEL_CACHE_SIZE)
 def fmt_day(date_str: str) -> str:
     """Format a date string as a short human-readable label.
 
@@ -22,10 +32,13 @@ def fmt_day(date_str: str) -> str:
     Returns:
         Formatted string like 'Mon 24 Feb'.
     """
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
+    # fromisoformat is C-implemented; strptime would import _strptime and
+    # compile a format regex on its first call
+    dt = datetime.fromisoformat(date_str)
     return dt.strftime("%a %d %b")
 
 
+@lru_cache(maxsize=LABEL_CACHE_SIZE)
 def fmt_hour(time_str: str) -> str:
     """Format an ISO datetime string as a short hour label.
 
@@ -35,12 +48,39 @@ def fmt_hour(time_str: str) -> str:
     Returns:
         Formatted string like 'HH:00'.
     """
-    dt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M")
+    dt = datetime.fromisoformat(time_str)
     return dt.strftime("%H:%M")
 
 DEFAULT_LOG_PATH = Path("logs/weather_alert.log")
 MAX_ATTEMPTS = 3
 RETRY_DELAY_SECONDS = 5
+HTTP_POOL_CONNECTIONS = 4  # distinct hosts kept in the pool (forecast, geocoding, archive)
+HTTP_POOL_MAXSIZE = 8      # keep-alive connections per host (covers concurrent fetches)
+
+
+@lru_cache(maxsize=1)
+def http_session() -> "requests.Session":
+    """Return the process-wide requests.Session shared by all API modules.
+
+    Reusing one session keeps TLS connections alive between calls (and across
+    threads when forecasts are fetched concurrently), and explicitly requests
+    gzip-compressed JSON.
+
+    Returns:
+        A requests.Session with a pooled HTTPS adapter mounted.
+    """
+    # requests is slow to import; deferring it keeps commands that never
+    # touch the network (status, install-schedule, --help) fast to start.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE),
+    )
+    return session
 
 
 def with_retry(
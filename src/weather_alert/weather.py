@@ -10,12 +10,16 @@ forecast_hours hours of data and return a clean list of dicts.
 API docs: https://open-meteo.com/en/docs
 """
 
-import requests
 from datetime import datetime
-from weather_alert.utils import with_retry, DEFAULT_LOG_PATH
+from weather_alert.cache import cache_path, load_cached, save_cached
+from weather_alert.utils import http_session, with_retry, DEFAULT_LOG_PATH
 
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+FORECAST_CACHE_TTL_SECONDS = 900  # Open-Meteo models update at most hourly
+FORECAST_REVALIDATE_SECONDS = 24 * 60 * 60  # expired entries this old are revalidated, not refetched
+HTTP_NOT_MODIFIED = 304
+COORD_CACHE_PRECISION = 4  # decimal places in cache keys; avoids misses from float noise
 
 # Fields we care about from the hourly forecast
 HOURLY_VARIABLES = [
@@ -71,6 +75,7 @@ def fetch_forecast(
     longitude: float,
     forecast_hours: int = 6,
     target_time_str: str | None = None,
+    cache_ttl: float | None = None,
 ) -> list[dict]:
     """Fetch an hourly weather forecast from Open-Meteo.
 
@@ -80,6 +85,11 @@ def fetch_forecast(
         forecast_hours: Number of hourly entries to return.
         target_time_str: ISO-format hour string ('YYYY-MM-DDTHH:00') to start
             from. Defaults to the current local hour.
+        cache_ttl: If set, reuse the raw 7-day API response from the on-disk
+            cache when it is younger than this many seconds, and revalidate
+            older entries with If-Modified-Since. The slice for the requested
+            hour is always cut fresh, so a cached response serves every
+            target time within its window.
 
     Returns:
         List of dicts, one per hour, each containing temperature, feels_like,
@@ -98,15 +108,67 @@ def fetch_forecast(
     }
 
     def _call():
-        r = requests.get(OPEN_METEO_URL, params=params, timeout=10)
+        r = http_session().get(OPEN_METEO_URL, params=params, timeout=10)
         r.raise_for_status()
         return r.json()
 
-    data = with_retry(_call, label="Open-Meteo forecast API")
+    label = "Open-Meteo forecast API"
+    if cache_ttl is None:
+        data = with_retry(_call, label=label)
+    else:
+        data = _fetch_cached("forecast", params, cache_ttl, label)
 
     return _parse_hourly(data, forecast_hours, target_time_str=target_time_str)
 
 
+def _fetch_cached(namespace: str, params: dict, cache_ttl: float, label: str) -> dict:
+    """Return the raw forecast API response through the on-disk cache.
+
+    A fresh entry is returned without any request. An expired one is sent
+    back to Open-Meteo as If-Modified-Since (the Date of the stored
+    response); on 304 Not Modified the stored payload is reused and its age
+    reset, skipping the body download and JSON decode.
+
+    Args:
+        namespace: Cache namespace, 'forecast' (hourly) or 'daily_forecast'.
+        params: Query parameters for the forecast request.
+        cache_ttl: Maximum age in seconds of an entry served without a request.
+        label: Human-readable API name for retry log messages.
+
+    Returns:
+        Raw JSON response dict from the Open-Meteo forecast API.
+
+    Raises:
+        RuntimeError: If all retry attempts fail.
+    """
+    path = cache_path(
+        namespace,
+        f"{params['latitude']:.{COORD_CACHE_PRECISION}f},"
+        f"{params['longitude']:.{COORD_CACHE_PRECISION}f},"
+        f"{params['forecast_days']}",
+    )
+    entry = load_cached(path, cache_ttl)
+    if entry is not None:
+        return entry["data"]
+
+    stale = load_cached(path, FORECAST_REVALIDATE_SECONDS)
+    headers = {"Cache-Control": f"max-age={int(cache_ttl)}"}
+    if stale is not None and stale.get("date"):
+        headers["If-Modified-Since"] = stale["date"]
+
+    def _call():
+        r = http_session().get(OPEN_METEO_URL, params=params, headers=headers, timeout=10)
+        if r.status_code == HTTP_NOT_MODIFIED:
+            return None
+        r.raise_for_status()
+        return {"data": r.json(), "date": r.headers.get("Date")}
+
+    # None means 304, which is only possible when a stale entry was sent
+    entry = with_retry(_call, label=label) or stale
+    save_cached(path, entry)
+    return entry["data"]
+
+
 def _parse_hourly(
     data: dict,
     forecast_hours: int,
@@ -177,6 +239,7 @@ def fetch_daily_forecast(
     latitude: float,
     longitude: float,
     forecast_days: int = 7,
+    cache_ttl: float | None = None,
 ) -> list[dict]:
     """Fetch a daily aggregated forecast from Open-Meteo.
 
@@ -184,6 +247,8 @@ def fetch_daily_forecast(
         latitude: Location latitude in decimal degrees.
         longitude: Location longitude in decimal degrees.
         forecast_days: Number of days to fetch (max 16).
+        cache_ttl: If set, reuse the raw API response for the same location
+            and forecast_days from the on-disk cache, as in fetch_forecast().
 
     Returns:
         List of dicts, one per day, containing date, temp_max, temp_min,
@@ -202,11 +267,15 @@ def fetch_daily_forecast(
     }
 
     def _call():
-        r = requests.get(OPEN_METEO_URL, params=params, timeout=10)
+        r = http_session().get(OPEN_METEO_URL, params=params, timeout=10)
         r.raise_for_status()
         return r.json()
 
-    data = with_retry(_call, label="Open-Meteo daily forecast API")
+    label = "Open-Meteo daily forecast API"
+    if cache_ttl is None:
+        data = with_retry(_call, label=label)
+    else:
+        data = _fetch_cached("daily_forecast", params, cache_ttl, label)
 
     try:
         daily = data["daily"]
@@ -121,6 +121,16 @@ class TestYearlySummary:
         """2021: snow_depth_max values [20.0, 0.0] → max = 20.0."""
         assert self.by_year[2021]["max_snow_depth"] == 20.0
 
+    def test_hottest_and_coldest_ties_use_first_date(self):
+        """When several days share the extreme value, the earliest one wins."""
+        records = [
+            {**SAMPLE_RECORDS[0], "date": date(2020, 3, 1), "temp_max": 30.0, "temp_min": -8.0},
+            {**SAMPLE_RECORDS[0], "date": date(2020, 6, 1), "temp_max": 30.0, "temp_min": -8.0},
+        ]
+        (summary,) = yearly_summary(records)
+        assert summary["hottest_date"] == date(2020, 3, 1)
+        assert summary["coldest_date"] == date(2020, 3, 1)
+
 
 # ---------------------------------------------------------------------------
 # monthly_climatology
@@ -307,6 +317,14 @@ class TestFindExtremes:
         """find_extremes([]) must return an empty dict."""
         assert find_extremes([]) == {}
 
+    def test_ties_resolve_to_earliest_year(self):
+        """Equal values must pick the first year, as max()/min() would."""
+        tied = [dict(y, year=y["year"] + i) for i, y in enumerate([self.yearly[0]] * 3)]
+        extremes = find_extremes(tied)
+        for key in ("hottest_year", "coldest_year", "wettest_year", "driest_year",
+                    "snowiest_year", "least_snow_year", "most_snow_days_year"):
+            assert extremes[key] == tied[0]["year"]
+
     def test_all_expected_keys_present(self):
         """Return dict must contain the full set of extreme keys."""
         expected_keys = {
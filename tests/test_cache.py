@@ -0,0 +1,94 @@
+# Project: weather-alert
+# Owner: GreenUnicorn
+# Built with: Claude (Anthropic)
+"""Tests for cache.py on-disk JSON cache."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from weather_alert.cache import cache_path, load_cached, save_cached, write_json_atomic
+
+
+# ---------------------------------------------------------------------------
+# cache_path
+# ---------------------------------------------------------------------------
+
+def test_cache_path_is_stable_for_same_key(tmp_path):
+    """The same namespace and key must always map to the same file."""
+    assert cache_path("geocode", "tokyo", tmp_path) == cache_path("geocode", "tokyo", tmp_path)
+
+
+def test_cache_path_differs_by_key_and_namespace(tmp_path):
+    """Different keys or namespaces must not collide."""
+    a = cache_path("geocode", "tokyo", tmp_path)
+    assert a != cache_path("geocode", "london", tmp_path)
+    assert a != cache_path("forecast", "tokyo", tmp_path)
+    assert a.name.startswith("geocode_")
+
+
+# ---------------------------------------------------------------------------
+# load_cached / save_cached
+# ---------------------------------------------------------------------------
+
+def test_save_then_load_round_trips(tmp_path):
+    """A freshly saved value should be returned within its TTL."""
+    path = cache_path("geocode", "tokyo", tmp_path)
+    value = {"latitude": 35.6895, "longitude": 139.6917, "name": "Tokyo, Japan"}
+    save_cached(path, value)
+    assert load_cached(path, ttl_seconds=60) == value
+
+
+def test_load_returns_none_when_expired(tmp_path):
+    """An entry older than the TTL is treated as a miss."""
+    path = cache_path("geocode", "tokyo", tmp_path)
+    with patch("weather_alert.cache.time.time", return_value=1_000.0):
+        save_cached(path, [1, 2, 3])
+    with patch("weather_alert.cache.time.time", return_value=1_061.0):
+        assert load_cached(path, ttl_seconds=60) is None
+        assert load_cached(path, ttl_seconds=120) == [1, 2, 3]
+
+
+def test_load_returns_none_for_missing_file(tmp_path):
+    """A missing cache file is a miss, not an error."""
+    assert load_cached(tmp_path / "nope.json", ttl_seconds=60) is None
+
+
+def test_load_returns_none_for_corrupt_file(tmp_path):
+    """A truncated or malformed file is a miss, not an error."""
+    path = tmp_path / "bad.json"
+    path.write_text('{"ts": 1')
+    assert load_cached(path, ttl_seconds=60) is None
+    path.write_text(json.dumps({"unexpected": True}))
+    assert load_cached(path, ttl_seconds=60) is None
+
+
+def test_save_creates_parent_directory(tmp_path):
+    """save_cached should create the cache directory on first use."""
+    path = cache_path("forecast", "key", tmp_path / "nested" / "dir")
+    save_cached(path, {"ok": True})
+    assert path.exists()
+
+
+# ---------------------------------------------------------------------------
+# write_json_atomic
+# ---------------------------------------------------------------------------
+
+def test_write_json_atomic_replaces_file_and_leaves_no_temp(tmp_path):
+    """The destination holds the new JSON and no temp files remain."""
+    path = tmp_path / "entry.json"
+    path.write_text('{"old": true}')
+    write_json_atomic(path, {"new": True})
+    assert json.loads(path.read_text()) == {"new": True}
+    assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
+
+
+def test_write_json_atomic_keeps_old_file_on_failure(tmp_path):
+    """A payload that fails to serialise must not clobber the existing file."""
+    path = tmp_path / "entry.json"
+    path.write_text('{"old": true}')
+    with pytest.raises(TypeError):
+        write_json_atomic(path, {"bad": object()})
+    assert json.loads(path.read_text()) == {"old": True}
+    assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
@@ -0,0 +1,84 @@
+# Project: weather-alert
+# Owner: GreenUnicorn
+# Built with: Claude (Anthropic)
+"""Tests for cli.py crontab job matching and --time parsing."""
+
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from weather_alert.cli import (
+    RUN_ONCE_JOB,
+    SKI_CHECK_JOB,
+    _parse_target_time,
+    cmd_uninstall_schedule,
+)
+
+
+ACTIVE_JOB = "0 * * * * /usr/local/bin/weather-alert run-once >> /tmp/cron.log 2>&1\n"
+COMMENTED_JOB = "# 0 * * * * /usr/local/bin/weather-alert run-once >> /tmp/cron.log 2>&1\n"
+SKI_JOB = "0 7 * * * /usr/local/bin/weather-alert ski-check >> /tmp/ski.log 2>&1\n"
+
+SAMPLE_CRONTAB = (
+    "MAILTO=me@example.com\n"
+    + ACTIVE_JOB
+    + COMMENTED_JOB
+    + SKI_JOB
+    + "30 2 * * * /usr/bin/backup.sh\n"
+)
+
+
+def test_run_once_job_matches_active_line():
+    assert RUN_ONCE_JOB.match(ACTIVE_JOB)
+    assert RUN_ONCE_JOB.search(SAMPLE_CRONTAB)
+
+
+def test_run_once_job_ignores_commented_and_unrelated_lines():
+    for line in ("MAILTO=me@example.com\n", COMMENTED_JOB, SKI_JOB, "30 2 * * * /usr/bin/backup.sh\n"):
+        assert not RUN_ONCE_JOB.match(line)
+
+
+def test_ski_check_job_matches_only_ski_line():
+    assert SKI_CHECK_JOB.match(SKI_JOB)
+    assert not SKI_CHECK_JOB.match(ACTIVE_JOB)
+    assert not SKI_CHECK_JOB.match("# " + SKI_JOB)
+
+
+def test_commented_job_alone_is_not_installed():
+    assert not RUN_ONCE_JOB.search("MAILTO=me@example.com\n" + COMMENTED_JOB)
+
+
+def test_uninstall_removes_only_active_job():
+    written = MagicMock(returncode=0)
+    with patch("weather_alert.cli._read_crontab", return_value=SAMPLE_CRONTAB), \
+         patch("weather_alert.cli._write_crontab", return_value=written) as mock_write:
+        cmd_uninstall_schedule(None)
+
+    assert mock_write.call_args.args[0] == (
+        "MAILTO=me@example.com\n"
+        + COMMENTED_JOB
+        + SKI_JOB
+        + "30 2 * * * /usr/bin/backup.sh\n"
+    )
+
+
+def test_uninstall_leaves_crontab_without_active_job_untouched():
+    with patch("weather_alert.cli._read_crontab", return_value="MAILTO=me@example.com\n" + COMMENTED_JOB), \
+         patch("weather_alert.cli._write_crontab") as mock_write:
+        cmd_uninstall_schedule(None)
+
+    mock_write.assert_not_called()
+
+
+def test_parse_target_time_hh_mm_is_today_truncated_to_hour():
+    assert _parse_target_time("14:35") == f"{date.today().isoformat()}T14:00"
+
+
+def test_parse_target_time_full_datetime():
+    assert _parse_target_time("2024-03-05 14:35") == "2024-03-05T14:00"
+
+
+@pytest.mark.parametrize("raw", ["25:00", "ab:cd", ""])
+def test_parse_target_time_invalid_returns_none(raw):
+    assert _parse_target_time(raw) is None
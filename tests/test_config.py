@@ -8,10 +8,11 @@ We write a temporary TOML file in each test so we don't depend on
 a real config.toml existing in the project.
 """
 
+import os
 import pytest
 import tomllib
 from pathlib import Path
-from weather_alert.config import load_config
+from weather_alert.config import _CONFIG_CACHE, load_config
 
 
 VALID_TOML = """
@@ -43,6 +44,14 @@ path = "logs/weather_alert.log"
 """
 
 
+@pytest.fixture(autouse=True)
+def _fresh_config_cache():
+    """Start every test with an empty load_config cache."""
+    _CONFIG_CACHE.clear()
+    yield
+    _CONFIG_CACHE.clear()
+
+
 def test_load_valid_config(tmp_path):
     """A valid config file should load without error."""
     config_file = tmp_path / "config.toml"
@@ -101,3 +110,28 @@ path = "logs/weather_alert.log"
 
     with pytest.raises(ValueError, match="name"):
         load_config(config_file)
+
+
+def test_repeat_load_reuses_parsed_config(tmp_path, monkeypatch):
+    """A second load of the same file must not re-read or re-parse it."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(VALID_TOML)
+    first = load_config(config_file)
+
+    monkeypatch.setattr("weather_alert.config.tomllib.load", lambda f: pytest.fail("re-parsed"))
+    monkeypatch.chdir(tmp_path)
+
+    assert load_config(Path("config.toml")) is first
+
+
+def test_edited_config_is_reloaded(tmp_path):
+    """A change to the file's mtime must invalidate the cached config."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(VALID_TOML)
+    load_config(config_file)
+
+    config_file.write_text(VALID_TOML.replace('name = "London"', 'name = "Paris"'))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_config(config_file)["location"]["name"] == "Paris"
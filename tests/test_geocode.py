@@ -131,3 +131,49 @@ def test_geocode_does_not_raise_system_exit_on_missing_location(monkeypatch):
         pass  # expected
     except SystemExit:
         pytest.fail("geocode raised SystemExit — should raise LocationNotFoundError instead")
+
+
+# ---------------------------------------------------------------------------
+# geocode — on-disk cache (cache_ttl)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def geocode_cache(tmp_path, monkeypatch):
+    """Route the geocode disk cache to tmp_path, keyed by the normalised place."""
+    monkeypatch.setattr(
+        "weather_alert.geocode.cache_path", lambda ns, key: tmp_path / f"{ns}_{key}.json"
+    )
+    return tmp_path
+
+
+def test_geocode_cache_hit_skips_api(monkeypatch, geocode_cache):
+    """A repeat lookup, even with different case and spacing, is served from disk."""
+    calls = []
+    payload = _make_geocode_response([_make_result()])
+    monkeypatch.setattr(
+        "weather_alert.geocode.with_retry", lambda fn, **kw: calls.append(1) or payload
+    )
+
+    first = geocode("Tokyo", cache_ttl=3600)
+    again = geocode("  tokyo ", cache_ttl=3600)
+
+    assert len(calls) == 1
+    assert again == first
+
+
+def test_geocode_cache_does_not_store_not_found(monkeypatch, geocode_cache):
+    monkeypatch.setattr("weather_alert.geocode.with_retry", lambda fn, **kw: {})
+
+    with pytest.raises(LocationNotFoundError):
+        geocode("xyznonexistent", cache_ttl=3600)
+
+    assert not list(geocode_cache.iterdir())
+
+
+def test_geocode_without_cache_ttl_skips_disk_cache(monkeypatch, geocode_cache):
+    payload = _make_geocode_response([_make_result()])
+    monkeypatch.setattr("weather_alert.geocode.with_retry", lambda fn, **kw: payload)
+
+    geocode("Tokyo")
+
+    assert not list(geocode_cache.iterdir())
@@ -8,6 +8,7 @@ from datetime import date, timedelta
 from unittest.mock import patch, MagicMock
 
 from weather_alert.history import date_range_for_years, _parse_daily, fetch_historical
+from weather_alert.utils import http_session
 
 
 # ---------------------------------------------------------------------------
@@ -229,7 +230,7 @@ class TestParseDaily:
 
 class TestFetchHistorical:
 
-    @patch("weather_alert.history.requests.get")
+    @patch.object(http_session(), "get")
     def test_returns_list(self, mock_get):
         """fetch_historical must return a list."""
         mock_response = MagicMock()
@@ -241,7 +242,7 @@ class TestFetchHistorical:
 
         assert isinstance(result, list)
 
-    @patch("weather_alert.history.requests.get")
+    @patch.object(http_session(), "get")
     def test_result_has_correct_structure(self, mock_get):
         """Each record in the result must have the 9 expected keys."""
         mock_response = MagicMock()
@@ -260,9 +261,9 @@ class TestFetchHistorical:
         for record in result:
             assert set(record.keys()) == expected_keys
 
-    @patch("weather_alert.history.requests.get")
+    @patch.object(http_session(), "get")
     def test_api_called_with_correct_lat_lon(self, mock_get):
-        """requests.get must receive the latitude and longitude in params."""
+        """The shared session's get must receive the latitude and longitude in params."""
         mock_response = MagicMock()
         mock_response.json.return_value = MOCK_API_RESPONSE
         mock_response.raise_for_status.return_value = None
@@ -271,13 +272,13 @@ class TestFetchHistorical:
         lat, lon = 51.5074, -0.1278
         fetch_historical(lat, lon, years=1)
 
-        assert mock_get.called, "requests.get was never called"
+        assert mock_get.called, "session.get was never called"
         _, kwargs = mock_get.call_args
         params = kwargs.get("params", {})
         assert params.get("latitude") == lat
         assert params.get("longitude") == lon
 
-    @patch("weather_alert.history.requests.get")
+    @patch.object(http_session(), "get")
     def test_api_called_with_date_range_params(self, mock_get):
         """requests.get params must include start_date and end_date."""
         mock_response = MagicMock()
@@ -295,7 +296,7 @@ class TestFetchHistorical:
         expected_end = (date.today() - timedelta(days=1)).isoformat()
         assert params["end_date"] == expected_end
 
-    @patch("weather_alert.history.requests.get")
+    @patch.object(http_session(), "get")
     def test_date_fields_are_date_objects(self, mock_get):
         """Parsed records returned by fetch_historical must have date objects."""
         mock_response = MagicMock()
@@ -308,7 +309,7 @@ class TestFetchHistorical:
         for record in result:
             assert isinstance(record["date"], date)
 
-    @patch("weather_alert.history.requests.get")
+    @patch.object(http_session(), "get")
     def test_result_length_matches_api_response(self, mock_get):
         """Number of records returned must equal number of dates in API response."""
         mock_response = MagicMock()
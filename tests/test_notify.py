@@ -16,7 +16,9 @@ import pytest
 
 from weather_alert.notify import (
     _log_alert,
+    _log_alerts,
     _send_macos_notification,
+    _send_macos_notifications,
     send_notifications,
     send_test_notification,
     send_weather_notification,
@@ -96,6 +98,21 @@ def test_send_macos_notification_success_prints_confirmation(mock_run, capsys):
     assert "macOS notification sent" in captured.out
 
 
+@patch("weather_alert.notify.subprocess.run")
+def test_send_macos_notifications_batches_into_one_osascript(mock_run):
+    """Several messages share one osascript call, still passed via env vars."""
+    mock_run.return_value = _make_run_ok()
+    _send_macos_notifications("Title", ['Rain "soon"', "Wind\\gusts"])
+    mock_run.assert_called_once()
+    script = mock_run.call_args[0][0][2]
+    env = mock_run.call_args.kwargs["env"]
+    assert script.count("display notification") == 2
+    assert "soon" not in script and "gusts" not in script
+    assert env["WA_TITLE"] == "Title"
+    assert env["WA_MSG_0"] == 'Rain "soon"'
+    assert env["WA_MSG_1"] == "Wind\\gusts"
+
+
 # ---------------------------------------------------------------------------
 # _log_alert
 # ---------------------------------------------------------------------------
@@ -117,6 +134,16 @@ def test_log_alert_writes_timestamped_line(mock_mkdir, mock_open):
     assert "|" not in written  # log uses plain text, not pipe-separated
 
 
+def test_log_alerts_appends_one_line_per_message(tmp_path):
+    log_path = tmp_path / "logs" / "alerts.log"
+    config = {"log": {"path": str(log_path)}}
+    _log_alerts(["first", "second"], config)
+    _log_alert("third", config)
+    lines = log_path.read_text().splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["first", "second", "third"]
+    assert all(line.startswith("[") for line in lines)
+
+
 @patch("builtins.open", side_effect=OSError("disk full"))
 @patch("pathlib.Path.mkdir")
 def test_log_alert_silences_os_error(mock_mkdir, mock_open, capsys):
@@ -131,17 +158,17 @@ def test_log_alert_silences_os_error(mock_mkdir, mock_open, capsys):
 # send_notifications
 # ---------------------------------------------------------------------------
 
-@patch("weather_alert.notify._send_macos_notification")
-@patch("weather_alert.notify._log_alert")
+@patch("weather_alert.notify._send_macos_notifications")
+@patch("weather_alert.notify._log_alerts")
 def test_send_notifications_macos_and_log(mock_log, mock_notif):
     config = {"notifications": {"macos": True, "log": True}, "log": {"path": "logs/x.log"}}
     send_notifications(["Alert one", "Alert two"], config)
-    assert mock_notif.call_count == 2
-    assert mock_log.call_count == 2
+    mock_notif.assert_called_once_with("Weather Alert", ["Alert one", "Alert two"])
+    mock_log.assert_called_once_with(["Alert one", "Alert two"], config)
 
 
-@patch("weather_alert.notify._send_macos_notification")
-@patch("weather_alert.notify._log_alert")
+@patch("weather_alert.notify._send_macos_notifications")
+@patch("weather_alert.notify._log_alerts")
 def test_send_notifications_macos_only(mock_log, mock_notif):
     config = {"notifications": {"macos": True, "log": False}}
     send_notifications(["Alert"], config)
@@ -149,8 +176,17 @@ def test_send_notifications_macos_only(mock_log, mock_notif):
     mock_log.assert_not_called()
 
 
-@patch("weather_alert.notify._send_macos_notification")
-@patch("weather_alert.notify._log_alert")
+@patch("weather_alert.notify._send_macos_notifications")
+@patch("weather_alert.notify._log_alerts")
+def test_send_notifications_no_alerts_skips_osascript(mock_log, mock_notif):
+    config = {"notifications": {"macos": True, "log": True}, "log": {"path": "logs/x.log"}}
+    send_notifications([], config)
+    mock_notif.assert_not_called()
+    mock_log.assert_not_called()
+
+
+@patch("weather_alert.notify._send_macos_notifications")
+@patch("weather_alert.notify._log_alerts")
 def test_send_notifications_neither_channel(mock_log, mock_notif):
     config = {"notifications": {"macos": False, "log": False}}
     send_notifications(["Alert"], config)
@@ -7,7 +7,15 @@ import pytest
 from unittest.mock import patch, MagicMock, call
 from pathlib import Path
 
-from weather_alert.utils import with_retry, write_last_run, read_last_run
+from weather_alert.utils import (
+    HTTP_POOL_MAXSIZE,
+    fmt_day,
+    fmt_hour,
+    http_session,
+    read_last_run,
+    with_retry,
+    write_last_run,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -76,3 +84,37 @@ def test_read_last_run_returns_most_recent(tmp_path):
     result = read_last_run(log_dir=tmp_path)
     assert result["status"] == "ERROR"
     assert result["detail"] == "API failed"
+
+
+# ---------------------------------------------------------------------------
+# http_session
+# ---------------------------------------------------------------------------
+
+def test_http_session_is_shared():
+    """Every caller should get the same pooled session object."""
+    assert http_session() is http_session()
+
+
+def test_http_session_requests_gzip_and_pools_https():
+    """The shared session asks for gzip and mounts a pooled HTTPS adapter."""
+    session = http_session()
+    assert "gzip" in session.headers["Accept-Encoding"]
+    adapter = session.get_adapter("https://api.open-meteo.com/v1/forecast")
+    assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+
+
+# ---------------------------------------------------------------------------
+# fmt_day / fmt_hour
+# ---------------------------------------------------------------------------
+
+def test_fmt_day_formats_iso_date():
+    assert fmt_day("2024-02-26") == "Mon 26 Feb"
+
+
+def test_fmt_hour_formats_iso_datetime():
+    assert fmt_hour("2024-02-26T07:00") == "07:00"
+
+
+def test_fmt_day_rejects_malformed_date():
+    with pytest.raises(ValueError):
+        fmt_day("26/02/2024")
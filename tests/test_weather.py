@@ -7,6 +7,9 @@ test_weather.py — Unit tests for weather.py.
 All tests use in-memory fake API payloads — no network calls.
 """
 
+import time
+from unittest.mock import patch
+
 import pytest
 
 from weather_alert.weather import (
@@ -150,6 +153,98 @@ def test_fetch_forecast_returns_list(hourly_payload):
     assert len(result) == 3
 
 
+class _FakeResponse:
+    def __init__(self, payload, status_code=200, date="Mon, 01 Jan 2024 00:00:00 GMT"):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = {"Date": date}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    """Stands in for http_session(); records request headers, replays responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture()
+def cached_fetch(tmp_path, monkeypatch):
+    """Route the forecast disk cache to tmp_path and run with_retry inline."""
+    monkeypatch.setattr(
+        "weather_alert.weather.cache_path", lambda ns, key: tmp_path / f"{ns}.json"
+    )
+    monkeypatch.setattr("weather_alert.weather.with_retry", lambda fn, **kw: fn())
+
+    def install(session):
+        monkeypatch.setattr("weather_alert.weather.http_session", lambda: session)
+        return session
+
+    return install
+
+
+def test_fetch_forecast_cache_hit_skips_api(hourly_payload, cached_fetch):
+    """A fresh cached response is sliced without calling the API again."""
+    session = cached_fetch(_FakeSession(_FakeResponse(hourly_payload)))
+
+    first = fetch_forecast(51.5, -0.1, forecast_hours=3,
+                           target_time_str="2024-01-01T00:00", cache_ttl=900)
+    later = fetch_forecast(51.5, -0.1, forecast_hours=2,
+                           target_time_str="2024-01-01T05:00", cache_ttl=900)
+
+    assert len(session.sent_headers) == 1
+    assert "If-Modified-Since" not in session.sent_headers[0]
+    assert len(first) == 3
+    assert later[0]["time"] == "2024-01-01T05:00"
+
+
+def test_fetch_forecast_reuses_expired_entry_on_304(hourly_payload, cached_fetch):
+    """An expired entry is revalidated with its Date and reused on 304."""
+    session = cached_fetch(_FakeSession(
+        _FakeResponse(hourly_payload, date="Mon, 01 Jan 2024 00:00:00 GMT"),
+        _FakeResponse(None, status_code=304),
+    ))
+
+    fetch_forecast(51.5, -0.1, forecast_hours=3,
+                   target_time_str="2024-01-01T00:00", cache_ttl=900)
+    with patch("weather_alert.cache.time.time", return_value=time.time() + 3600):
+        result = fetch_forecast(51.5, -0.1, forecast_hours=3,
+                                target_time_str="2024-01-01T00:00", cache_ttl=900)
+
+    assert session.sent_headers[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert [h["time"] for h in result] == [
+        "2024-01-01T00:00", "2024-01-01T01:00", "2024-01-01T02:00",
+    ]
+
+
+def test_fetch_forecast_without_cache_ttl_always_calls_api(hourly_payload, tmp_path, monkeypatch):
+    """cache_ttl=None (the default) must not read or write the disk cache."""
+    calls = []
+    monkeypatch.setattr(
+        "weather_alert.weather.cache_path", lambda ns, key: tmp_path / f"{ns}.json"
+    )
+    monkeypatch.setattr(
+        "weather_alert.weather.with_retry",
+        lambda fn, **kw: calls.append(1) or hourly_payload,
+    )
+
+    for _ in range(2):
+        fetch_forecast(51.5, -0.1, forecast_hours=3, target_time_str="2024-01-01T00:00")
+
+    assert len(calls) == 2
+    assert not list(tmp_path.iterdir())
+
+
 # ---------------------------------------------------------------------------
 # fetch_daily_forecast — mock with_retry to return fake daily payload
 # ---------------------------------------------------------------------------
@@ -233,3 +328,14 @@ def test_fetch_daily_forecast_snow_depth_cm_conversion():
         )
         result = fetch_daily_forecast(latitude=51.5, longitude=-0.1, forecast_days=1)
     assert result[0]["snow_depth_cm"] == pytest.approx(raw_meters * 100)
+
+
+def test_fetch_daily_forecast_cache_hit_skips_api(cached_fetch):
+    """A fresh cached daily response is reused for the same location and day count."""
+    session = cached_fetch(_FakeSession(_FakeResponse(_make_daily_payload(n=3))))
+
+    first = fetch_daily_forecast(51.5, -0.1, forecast_days=3, cache_ttl=900)
+    again = fetch_daily_forecast(51.5, -0.1, forecast_days=3, cache_ttl=900)
+
+    assert len(session.sent_headers) == 1
+    assert again == first